@@ -30,6 +30,8 @@ from datetime import datetime
 
 from flask import Flask, Response, jsonify, render_template, request as flask_request, send_file
 
+from src.utils import clock_stamp, entry_age
+
 # ── Logging ───────────────────────────────────────────────────────────────
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -80,6 +82,9 @@ app = Flask(
     __name__,
     template_folder=os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates"),
 )
+# Compact JSON responses — no indentation whitespace on the wire, even when
+# Flask runs in debug mode (workers never read these by eye).
+app.json.compact = True
 # Suppress Flask's default request logging — we log manually
 log = logging.getLogger("werkzeug")
 log.setLevel(logging.WARNING)
@@ -108,7 +113,7 @@ def _save_to_disk() -> None:
         with _lock:
             snapshot = dict(_data)
         with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(snapshot, f, indent=2)
+            json.dump(snapshot, f, separators=(",", ":"))
         os.replace(tmp, _data_file)
         logger.debug(f"Auto-saved {len(snapshot)} entries to {_data_file}")
     except Exception as e:
@@ -130,12 +135,13 @@ def _auto_save_loop() -> None:
 #  Stale-entry helper
 # ═══════════════════════════════════════════════════════════════════════════
 
-def _is_stale(entry: dict) -> bool:
+def _is_stale(entry: dict, wall: float | None = None, mono: float | None = None) -> bool:
     """Return True if a 'held' entry has exceeded the stale timeout."""
     if entry.get("status") != STATUS_HELD:
         return False
-    age = time.time() - entry.get("updated_at", 0)
-    return age >= _stale_timeout
+    if wall is None or mono is None:
+        wall, mono = time.time(), time.monotonic()
+    return entry_age(entry, wall, mono) >= _stale_timeout
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -165,6 +171,7 @@ def claim():
     if not url:
         return jsonify({"ok": False, "error": "missing url"}), 400
 
+    now, mono = time.time(), time.monotonic()
     with _lock:
         entry = _data.get(url)
 
@@ -173,23 +180,22 @@ def claim():
             if status in (STATUS_DONE, STATUS_FAILED):
                 logger.debug(f"CLAIM DENIED  {url[-40:]}  (status={status})")
                 return jsonify({"ok": False})
-            if status == STATUS_HELD and not _is_stale(entry):
-                logger.debug(f"CLAIM DENIED  {url[-40:]}  (held by '{entry.get('holder')}')")
-                return jsonify({"ok": False})
-            if status == STATUS_HELD and _is_stale(entry):
-                age = time.time() - entry.get("updated_at", 0)
+            if status == STATUS_HELD:
+                age = entry_age(entry, now, mono)
+                if age < _stale_timeout:
+                    logger.debug(f"CLAIM DENIED  {url[-40:]}  (held by '{entry.get('holder')}')")
+                    return jsonify({"ok": False})
                 logger.info(
                     f"RECLAIM stale  {url[-40:]}  "
                     f"(was '{entry.get('holder')}' for {age:.0f}s) → '{holder}'"
                 )
 
-        now = time.time()
         _data[url] = {
             "status":     STATUS_HELD,
             "holder":     holder,
             "worker":     worker,
             "claimed_at": entry.get("claimed_at", now) if entry else now,
-            "updated_at": now,
+            **clock_stamp(now, mono),
         }
 
     logger.info(f"CLAIMED       {url[-40:]}  by '{holder}' on {worker}")
@@ -217,7 +223,7 @@ def batch_claim():
 
     granted = []
     denied = []
-    now = time.time()
+    now, mono = time.time(), time.monotonic()
 
     with _lock:
         for url in urls:
@@ -228,7 +234,7 @@ def batch_claim():
                 status = entry.get("status")
                 if status in (STATUS_DONE, STATUS_FAILED):
                     claimable = False
-                elif status == STATUS_HELD and not _is_stale(entry):
+                elif status == STATUS_HELD and not _is_stale(entry, now, mono):
                     claimable = False
 
             if claimable:
@@ -237,7 +243,7 @@ def batch_claim():
                     "holder":     holder,
                     "worker":     worker,
                     "claimed_at": entry.get("claimed_at", now) if entry else now,
-                    "updated_at": now,
+                    **clock_stamp(now, mono),
                 }
                 granted.append(url)
             else:
@@ -261,7 +267,12 @@ def done():
 
     with _lock:
         entry = _data.get(url, {})
-        _data[url] = {**entry, "status": STATUS_DONE, "worker": worker, "updated_at": time.time()}
+        _data[url] = {
+            **entry,
+            "status":     STATUS_DONE,
+            "worker":     worker,
+            **clock_stamp(),
+        }
 
     logger.info(f"DONE          {url[-40:]}  by {worker}")
     return jsonify({"ok": True})
@@ -283,7 +294,7 @@ def failed():
             **entry,
             "status":     STATUS_FAILED,
             "worker":     worker,
-            "updated_at": time.time(),
+            **clock_stamp(),
             "error":      error,
         }
 
@@ -473,7 +484,7 @@ def log_stream():
                     entry = sub_q.get(timeout=30)
                     if worker_filter and entry.get("worker") != worker_filter:
                         continue
-                    yield f"event: log\ndata: {json.dumps(entry)}\n\n"
+                    yield f"event: log\ndata: {json.dumps(entry, separators=(',', ':'))}\n\n"
                 except queue.Empty:
                     # Send keepalive comment to prevent timeout
                     yield ": keepalive\n\n"
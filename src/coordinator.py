@@ -31,7 +31,7 @@ from urllib.parse import quote
 
 import requests as _requests
 
-from src.utils import get_worker_id
+from src.utils import clock_stamp, entry_age, get_worker_id
 
 logger = logging.getLogger("roboflow_batch")
 
@@ -52,6 +52,8 @@ class URLCoordinator:
         "holder":     "top_down" | "bottom_up",
         "claimed_at": <unix timestamp>,
         "updated_at": <unix timestamp>,
+        "monotonic_updated_at": <time.monotonic()>  (stale checks only)
+        "monotonic_clock": [<host>, <boot time>]     (see utils.entry_age)
         "error":      "..." (only on failed)
       },
       ...
@@ -62,12 +64,24 @@ class URLCoordinator:
     This recovers cleanly from process crashes.
     """
 
-    def __init__(self, filepath: str, stale_timeout: int = 1800):
+    def __init__(
+        self,
+        filepath: str,
+        stale_timeout: int = 1800,
+        *,
+        pretty: bool = False,
+        compress: bool = False,
+    ):
         """
         Args:
             filepath: Absolute path to the coordination JSON file.
             stale_timeout: Seconds before a "held" claim is considered
                            abandoned (process crashed). Default: 1800 (30 min).
+            pretty: Write the file indented for human inspection.
+                    Default: False (compact — roughly half the bytes per write).
+            compress: Store the file zstd-compressed (level 1). The repetitive
+                      URL prefixes compress ~10×, cutting disk IO per mutation.
+                      Requires the zstandard package. Default: False.
         """
         try:
             from filelock import FileLock
@@ -77,9 +91,25 @@ class URLCoordinator:
                 "Install it with: pip install filelock>=3.0"
             ) from e
 
+        self._zstd_c = None
+        self._zstd_d = None
+        self._codec_errors: tuple = ()
+        if compress:
+            try:
+                import zstandard as zstd
+            except ImportError as e:
+                raise ImportError(
+                    "zstandard package is required for coordination_compress. "
+                    "Install it with: pip install zstandard"
+                ) from e
+            self._zstd_c = zstd.ZstdCompressor(level=1)
+            self._zstd_d = zstd.ZstdDecompressor()
+            self._codec_errors = (zstd.ZstdError,)
+
         self._filepath = filepath
         self._lockpath = filepath + ".lock"
         self._stale_timeout = stale_timeout
+        self._pretty = pretty
         self._lock = FileLock(self._lockpath, timeout=30)
         self.enabled = True
 
@@ -104,13 +134,14 @@ class URLCoordinator:
         with self._lock:
             data = self._read()
             entry = data.get(url)
+            now, mono = time.time(), time.monotonic()
 
             if entry is not None:
                 status = entry.get("status")
                 if status in (STATUS_DONE, STATUS_FAILED):
                     return False  # Already processed — skip
                 if status == STATUS_HELD:
-                    age = time.time() - entry.get("updated_at", 0)
+                    age = entry_age(entry, now, mono)
                     if age < self._stale_timeout:
                         return False  # Actively held by another process
                     # Stale — reclaim
@@ -119,12 +150,11 @@ class URLCoordinator:
                         f"(held by '{entry.get('holder')}' for {age:.0f}s)"
                     )
 
-            now = time.time()
             data[url] = {
                 "status":     STATUS_HELD,
                 "holder":     holder,
                 "claimed_at": entry.get("claimed_at", now) if entry else now,
-                "updated_at": now,
+                **clock_stamp(now, mono),
             }
             self._write(data)
             logger.debug(f"  [coord] Claimed {url[-30:]} for '{holder}'")
@@ -153,7 +183,7 @@ class URLCoordinator:
             data[url] = {
                 **entry,
                 "status":     STATUS_FAILED,
-                "updated_at": time.time(),
+                **clock_stamp(),
                 "error":      error[:200],  # truncate for readability
             }
             self._write(data)
@@ -181,7 +211,7 @@ class URLCoordinator:
         if status == STATUS_DONE:
             return False
         if status == STATUS_HELD:
-            age = time.time() - entry.get("updated_at", 0)
+            age = entry_age(entry, time.time(), time.monotonic())
             return age >= self._stale_timeout  # stale → available
         if status == STATUS_FAILED:
             return True  # Failed entries get one more chance
@@ -225,9 +255,12 @@ class URLCoordinator:
         if not os.path.exists(self._filepath):
             return {}
         try:
+            if self._zstd_d is not None:
+                with open(self._filepath, "rb") as f:
+                    return json.loads(self._zstd_d.decompress(f.read()))
             with open(self._filepath, "r", encoding="utf-8") as f:
                 return json.load(f)
-        except (json.JSONDecodeError, OSError):
+        except (json.JSONDecodeError, OSError, *self._codec_errors):
             logger.warning(f"Coordination file corrupt or unreadable — starting fresh")
             return {}
 
@@ -237,8 +270,16 @@ class URLCoordinator:
         tmp = self._filepath + ".tmp"
         try:
             os.makedirs(os.path.dirname(self._filepath), exist_ok=True) if os.path.dirname(self._filepath) else None
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            if self._pretty:
+                text = json.dumps(data, indent=2)
+            else:
+                text = json.dumps(data, separators=(",", ":"))
+            if self._zstd_c is not None:
+                with open(tmp, "wb") as f:
+                    f.write(self._zstd_c.compress(text.encode("utf-8")))
+            else:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(text)
             os.replace(tmp, self._filepath)
         except Exception as e:
             logger.warning(f"Failed to write coordination file: {e}")
@@ -255,7 +296,7 @@ class URLCoordinator:
             data[url] = {
                 **entry,
                 "status":     new_status,
-                "updated_at": time.time(),
+                **clock_stamp(),
             }
             self._write(data)
 
@@ -621,8 +662,19 @@ def build_coordinator(config: dict) -> "URLCoordinator | NullCoordinator | HTTPC
     coord_file_rel = config.get("coordination_file", "coordination.json")
     coord_file = os.path.join(root, coord_file_rel)
 
+    # Compressed files get their own extension so a plain-JSON file from an
+    # earlier session is never mis-read as zstd (or vice versa).
+    compress = config.get("coordination_compress", False)
+    if compress and not coord_file.endswith(".zst"):
+        coord_file += ".zst"
+
     stale_timeout = config.get("coordination_stale_timeout", 1800)
-    coordinator = URLCoordinator(coord_file, stale_timeout=stale_timeout)
+    coordinator = URLCoordinator(
+        coord_file,
+        stale_timeout=stale_timeout,
+        pretty=config.get("coordination_pretty_json", False),
+        compress=compress,
+    )
 
     if config.get("coordination_reset_on_start", True):
         coordinator.reset()
@@ -24,9 +24,13 @@ Principles implemented:
 """
 
 import re
+import collections
+import functools
+import itertools
 import logging
 import time
-from playwright.sync_api import Page, BrowserContext
+import weakref
+from playwright.sync_api import Page, BrowserContext, JSHandle
 
 from src.utils import capture_diagnostics, adaptive_timeout
 
@@ -43,6 +47,26 @@ MAX_CARD_RETRIES   = 2              # how many times to re-queue a failed card U
 DETAIL_VIEW        = ".AnnotationJobDetailView"  # unique detail-panel wrapper
 BLACKLIST_THRESHOLD = 3             # consecutive errors before a tab URL is blacklisted
 
+# Detail-view selectors used by the tick steps (built once, so they also
+# serve as stable keys for the per-page locator cache)
+_ANNOTATED_TAB_SEL   = f"{DETAIL_VIEW} .AnnotationJobImageList button:has-text('Annotated')"
+_UNANNOTATED_TAB_SEL = f"{DETAIL_VIEW} .AnnotationJobImageList button:has-text('Unannotated')"
+_NULL_BTN_SEL        = f"{DETAIL_VIEW} button:has(i.far.fa-empty-set)"
+_IMAGE_CONTAINER_SEL = f"{DETAIL_VIEW} #annotationContainer"
+_TAB_CONTENT_SEL     = (
+    f"{DETAIL_VIEW} .ImageCard, "
+    f"{DETAIL_VIEW} .ImageItem, "
+    f"{DETAIL_VIEW} .ImagesCollectionGrid, "
+    f"{DETAIL_VIEW} #annotationContainer .ImageCollection"
+)
+_ADD_BTN_SEL         = f"{DETAIL_VIEW} button.btn2.medium.primary:has-text('to Dataset'):not([disabled])"
+_MODAL_BTN_ID        = "AddApprovedImagesToDatasetButton"
+_MODAL_BTN_SEL       = f".dialogPanel button.primary, #{_MODAL_BTN_ID}"
+_DIALOG_SEL          = ".dialogPanel"
+_SWAL_POPUP_SEL      = ".swal2-popup"
+_SWAL_CONFIRM_SEL    = "button.swal2-confirm"
+_SWAL_PROGRESS_SEL   = "#swal2-content .text-sm.text-gray-500"
+
 # Board selectors
 _ANNOTATING_COL  = '.boardColumn:has(h2:text("Annotating"))'
 _VIRTUOSO        = '[data-test-id="virtuoso-scroller"]'
@@ -51,69 +75,80 @@ _MAX_BOTTOM_SCROLL_ATTEMPTS = 20
 # Fiber-based bulk extraction
 _FIBER_PROBE_TIMEOUT = 5_000        # ms to spend probing React fiber
 _SCROLL_STEP_PX      = 1200         # pixels per scroll step during bulk extraction
+_SCROLL_SETTLE_MS    = 400          # max ms to wait for Virtuoso to re-render after a step
+_SCROLL_TO_INDEX_JUMPS = 4          # measured corrective jumps in _scroll_to_card
 
 # Tier 0: Firestore subscription intercept — regex to extract job IDs from POST bodies
-_FIRESTORE_JOB_RE       = re.compile(r'annotation_jobs/([A-Za-z0-9]{15,30})/timeline')
-_FIRESTORE_JOB_RE_BYTES = re.compile(rb'annotation_jobs/([A-Za-z0-9]{15,30})')  # for binary gRPC bodies
+_FIRESTORE_JOB_RE       = re.compile(r'annotation_jobs/([A-Za-z0-9]{15,30})/timeline', re.ASCII)
+# for raw request bodies: binary gRPC, or form-encoded WebChannel (%2F)
+_FIRESTORE_JOB_RE_BYTES = re.compile(rb'annotation_jobs(?:/|%2[Ff])([A-Za-z0-9]{15,30})', re.ASCII)
 _FIRESTORE_HOST         = "firestore.googleapis.com"
+_TIER0_FIRST_ID_S       = 3.0   # hand over to Tier 1 if no ID arrives this soon after reload
 
-# JavaScript fetch() monkey-patch — injected via page.add_init_script().
-# Intercepts Firestore calls at the JS layer, completely above HTTP/2, so it
-# works regardless of transport version (gRPC-Web, HTTP/2, etc.).
-# Calls window._pyFirestoreCapture(jobId) for every job ID found in a POST body.
-_JS_FIRESTORE_FETCH_PATCH = r"""
-(function () {
-    if (window.__firestorePatchInstalled) return;
-    window.__firestorePatchInstalled = true;
-
-    const RE = /annotation_jobs\/([A-Za-z0-9]{15,30})/g;
-    const _orig = window.fetch;
-
-    window.fetch = async function (resource, options) {
-        const url = (typeof resource === 'string' ? resource : resource?.url) || '';
-        if (url.includes('firestore.googleapis.com') && options && options.body) {
-            try {
-                const body = options.body;
-                let arr = null;
-                if (body instanceof ArrayBuffer) {
-                    arr = new Uint8Array(body);
-                } else if (ArrayBuffer.isView(body)) {
-                    arr = new Uint8Array(body.buffer, body.byteOffset, body.byteLength);
-                }
-                if (arr) {
-                    // Latin-1 decode preserves ASCII job ID bytes intact
-                    let s = '';
-                    for (let i = 0; i < arr.length; i++) s += String.fromCharCode(arr[i]);
-                    let m;
-                    RE.lastIndex = 0;
-                    while ((m = RE.exec(s)) !== null) {
-                        if (window._pyFirestoreCapture) window._pyFirestoreCapture(m[1]);
-                    }
-                }
-            } catch (e) { /* never break the page */ }
-        }
-        return _orig.apply(this, arguments);
-    };
-})();
-"""
+# Job detail page URL (…/annotate/job/<id>) — matched against page.url
+_ANNOTATE_JOB_URL_RE    = re.compile(r'/annotate/job/', re.ASCII)
+
+# Text parsing for header spans, card image counts and the progress modal
+_RE_DIGIT        = re.compile(r"(\d+)", re.ASCII)
+_RE_IMAGES       = re.compile(r"(\d+)\s+Images", re.ASCII)
+_RE_IMAGE_HEADER = re.compile(r"(\d+)\s+[Ii]mage", re.ASCII)
+_RE_PROGRESS     = re.compile(r"(\d+)\s+of\s+(\d+)", re.ASCII)
 
 
 # =================================================================================
 #  Tier 1: React Fiber Bulk URL Extraction
 # =================================================================================
 
-# JS code to discover React fiber properties on the first visible card.
-# Returns {id_key, img_key, sample_id} or null if fiber access fails.
-_JS_PROBE_FIBER = """
-() => {
-    const col = (() => {
-        const cols = document.querySelectorAll('.boardColumn');
-        for (const c of cols) {
-            const h2 = c.querySelector('h2');
-            if (h2 && h2.textContent.trim() === 'Annotating') return c;
+# JS function body that locates the Annotating column element.
+_JS_ANNOTATING_COL_LOOKUP = """
+    const cols = document.querySelectorAll('.boardColumn');
+    for (const c of cols) {
+        const h2 = c.querySelector('h2');
+        if (h2 && h2.textContent.trim() === 'Annotating') return c;
+    }
+    return null;
+"""
+_JS_FIND_ANNOTATING_COL = "() => {" + _JS_ANNOTATING_COL_LOOKUP + "}"
+
+# Resolve as soon as the Annotating column has a rendered div[data-index] card.
+# A MutationObserver on document.body wakes on the insertion itself instead of
+# Playwright's selector polling.  Arg: timeoutMs.  Resolves false on timeout.
+_JS_WAIT_FOR_CARDS = """
+(timeoutMs) => new Promise(resolve => {
+    const hasCard = () => {
+        const col = (() => {""" + _JS_ANNOTATING_COL_LOOKUP + """})();
+        if (!col) return false;
+        for (const w of col.querySelectorAll('div[data-index]')) {
+            if (w.getClientRects().length) return true;
         }
-        return null;
-    })();
+        return false;
+    };
+    if (hasCard()) return resolve(true);
+    let timer = null;
+    const obs = new MutationObserver(() => {
+        if (!hasCard()) return;
+        obs.disconnect();
+        clearTimeout(timer);
+        resolve(true);
+    });
+    obs.observe(document.body, {subtree: true, childList: true});
+    timer = setTimeout(() => { obs.disconnect(); resolve(false); }, timeoutMs);
+})
+"""
+
+# Prologue for scripts that receive the cached column handle as args[0]:
+# re-resolves the column when React has replaced the element since caching.
+_JS_RESOLVE_COL = (
+    "    if (!col || !col.isConnected) col = (() => {"
+    + _JS_ANNOTATING_COL_LOOKUP
+    + "    })();\n"
+)
+
+# JS function that discovers React fiber properties on the first visible card
+# of a column.  Returns {id_key, img_key, sample_id, fiber_key_hint} or null.
+# Installed once per document by _JS_FIBER_HELPERS as window.__probeFiber.
+_JS_PROBE_FIBER_FN = """
+function (col) {
     if (!col) return null;
 
     const card = col.querySelector('div[data-index]');
@@ -153,8 +188,6 @@ _JS_PROBE_FIBER = """
         }
     }
     // Priority 2: broad regex scan — skip obvious metadata keys.
-    const ID_RE = /^[A-Za-z0-9]{16,30}$/;
-    const _SKIP_KEYS = new Set(['owner', 'project', 'reviewer', 'labeler', 'createdBy', 'name', 'sourceBatch', 'status', 'instructionsText']);
     if (!id_key) {
         for (const [k, v] of Object.entries(item)) {
             if (_SKIP_KEYS.has(k)) continue;
@@ -190,28 +223,47 @@ _JS_PROBE_FIBER = """
         sample_id: item[id_key],
         sample_img: img_key ? item[img_key] : null,
         all_keys: Object.keys(item),
+        fiber_key_hint: fiberKey,
     };
 }
 """
 
-# JS to extract cards from all visible div[data-index] elements.
-# Keys are passed as JS arguments [idKey, imgKey, fiberKeyHint] — NOT via .format().
-_JS_EXTRACT_CARDS = """
-(args) => {
-    const [idKey, imgKey, fiberKeyHint] = args;
-    const col = (() => {
-        const cols = document.querySelectorAll('.boardColumn');
-        for (const c of cols) {
-            const h2 = c.querySelector('h2');
-            if (h2 && h2.textContent.trim() === 'Annotating') return c;
-        }
-        return null;
-    })();
-    if (!col) return [];
+# Skip codes returned per card by _JS_EXTRACT_FN (0 = usable).
+_SKIP_NONE, _SKIP_IMAGES, _SKIP_DONE, _SKIP_HELD, _SKIP_BLACKLIST = range(5)
+
+# Installs the per-batch filter state used by _JS_EXTRACT_FN on the page.
+# Arg: [baseJobUrl, minImages, doneUrls, heldUrls, blacklistUrls].
+_JS_INSTALL_FILTER_SETS = """
+([base, minImages, done, held, bl]) => {
+    window.__filterSets = {
+        base, minImages,
+        done: new Set(done), held: new Set(held), bl: new Set(bl),
+    };
+}
+"""
 
+# JS function that extracts cards from all rendered div[data-index] elements
+# of a column, builds each job URL from window.__filterSets.base and applies
+# the batch filters page-side.  Returns parallel arrays {indices, urls, skips}
+# (structure of arrays) — one entry per card; skips holds a _SKIP_* code.
+# Walks cards in chunks of 32 and yields to the event loop between
+# chunks when the browser reports pending input, so React/Virtuoso can render.
+# Installed once per document by _JS_FIBER_HELPERS as window.__extractCards.
+_JS_EXTRACT_FN = """
+async function (col, idKey, imgKey, fiberKeyHint) {
+    const CHUNK = 32;
+    const F = window.__filterSets;
+    if (!F) throw new Error('filter sets not installed');
     const wrappers = col.querySelectorAll('div[data-index]');
-    const results = [];
-    for (const w of wrappers) {
+    const indices = [], urls = [], skips = [];
+    const pending = navigator.scheduling && navigator.scheduling.isInputPending
+        ? () => navigator.scheduling.isInputPending()
+        : () => false;
+    for (let n = 0; n < wrappers.length; n++) {
+        if (n && n % CHUNK === 0 && pending()) {
+            await new Promise(r => setTimeout(r, 0));
+        }
+        const w = wrappers[n];
         const idx = parseInt(w.getAttribute('data-index'), 10);
         if (isNaN(idx)) continue;
 
@@ -236,16 +288,256 @@ _JS_EXTRACT_CARDS = """
         }
         if (!item || !item[idKey]) continue;
 
-        results.push({
-            index: idx,
-            job_id: item[idKey],
-            img_count: imgKey && typeof item[imgKey] === 'number' ? item[imgKey] : -1,
+        const url = F.base + item[idKey];
+        const imgs = imgKey && typeof item[imgKey] === 'number' ? item[imgKey] : -1;
+        indices.push(idx);
+        urls.push(url);
+        skips.push(
+            imgs >= 0 && imgs < F.minImages ? """ + str(_SKIP_IMAGES) + """
+            : F.done.has(url) ? """ + str(_SKIP_DONE) + """
+            : F.held.has(url) ? """ + str(_SKIP_HELD) + """
+            : F.bl.has(url) ? """ + str(_SKIP_BLACKLIST) + """
+            : """ + str(_SKIP_NONE) + """
+        );
+    }
+    return {indices, urls, skips};
+}
+"""
+
+# Fused scroll + settle + extract — one CDP round-trip per viewport.
+# Keys are passed as JS arguments [colHandle, stepPx, idKey, imgKey,
+# fiberKeyHint, settleMs] — NOT via .format().  stepPx > 0 scrolls down, < 0 up,
+# 0 extracts in place.  After scrolling, waits two frames and then (up to
+# settleMs) until Virtuoso has swapped the rendered items.
+# Returns {cards: {indices, urls, skips}, atEnd} — atEnd is true when the scroller cannot move further
+# in the step direction.
+_JS_SCROLL_AND_EXTRACT = """
+async (args) => {
+    let [col, step, idKey, imgKey, fiberKeyHint, settleMs] = args;
+""" + _JS_RESOLVE_COL + """    if (!col) return {cards: {indices: [], urls: [], skips: []}, atEnd: true};
+
+    const scroller = col.querySelector('[data-test-id="virtuoso-scroller"]');
+    let atEnd = !scroller;
+    if (scroller && step) {
+        const firstIdx = () => {
+            const w = col.querySelector('div[data-index]');
+            return w ? w.getAttribute('data-index') : null;
+        };
+        // requestAnimationFrame stalls in background tabs — cap each frame.
+        const frame = () => new Promise(r => {
+            requestAnimationFrame(() => r());
+            setTimeout(r, 100);
         });
+        const before = firstIdx();
+        const prevTop = scroller.scrollTop;
+        scroller.scrollTop = Math.max(0, prevTop + step);
+        if (scroller.scrollTop === prevTop) {
+            atEnd = true;
+        } else {
+            const deadline = performance.now() + settleMs;
+            await frame();
+            await frame();
+            while (firstIdx() === before && performance.now() < deadline) await frame();
+        }
+    }
+    if (scroller && !atEnd) {
+        atEnd = step < 0
+            ? scroller.scrollTop <= 0
+            : scroller.scrollTop + scroller.clientHeight >= scroller.scrollHeight - 1;
     }
-    return results;
+    return {
+        cards: await window.__extractCards(col, idKey, imgKey, fiberKeyHint),
+        atEnd: atEnd,
+    };
 }
 """
 
+# Jump the Annotating column's scroller to its top or bottom edge.
+# Args [colHandle, toBottom].  Returns false when no scroller is rendered.
+_JS_SCROLL_TO_EDGE = """
+([col, toBottom]) => {
+""" + _JS_RESOLVE_COL + """    const scroller = col && col.querySelector('[data-test-id="virtuoso-scroller"]');
+    if (!scroller) return false;
+    scroller.scrollTop = toBottom ? scroller.scrollHeight : 0;
+    return true;
+}
+"""
+
+# Highest data-index rendered in the Annotating column, -1 when none.
+# Args [colHandle].
+_JS_MAX_RENDERED_INDEX = """
+([col]) => {
+""" + _JS_RESOLVE_COL + """    if (!col) return -1;
+    let max = -1;
+    for (const w of col.querySelectorAll('div[data-index]')) {
+        const idx = parseInt(w.getAttribute('data-index'), 10);
+        if (idx > max) max = idx;
+    }
+    return max;
+}
+"""
+
+# Resolve once the column's scroller has held the same scrollTop and first
+# rendered data-index for two consecutive frames.  Args [colHandle, timeoutMs].
+# Resolves false on timeout or when no scroller is rendered.
+_JS_WAIT_SCROLL_SETTLED = """
+async ([col, timeoutMs]) => {
+""" + _JS_RESOLVE_COL + """    const scroller = col && col.querySelector('[data-test-id="virtuoso-scroller"]');
+    if (!scroller) return false;
+    const frame = () => new Promise(r => {
+        requestAnimationFrame(() => r());
+        setTimeout(r, 100);
+    });
+    const state = () => {
+        const w = scroller.querySelector('div[data-index]');
+        return scroller.scrollTop + ':' + (w ? w.getAttribute('data-index') : '');
+    };
+    const deadline = performance.now() + timeoutMs;
+    let prev = state(), stable = 0;
+    while (performance.now() < deadline) {
+        await frame();
+        const cur = state();
+        stable = cur === prev ? stable + 1 : 0;
+        if (stable >= 2) return true;
+        prev = cur;
+    }
+    return false;
+}
+"""
+
+# Scroll the Annotating column's Virtuoso scroller until div[data-index=target]
+# is rendered, in one evaluate.  Args [colHandle, target, avgHint, settleMs,
+# maxJumps].  The first jump uses
+# target * avg; each later jump corrects by (target - firstRendered) * avg,
+# where avg is re-measured from the rendered wrappers (data-known-size, else
+# their bounding box).  Once found, the card is brought inside the viewport.
+# Returns {found, avg}, or null when no scroller is rendered.
+_JS_SCROLL_TO_INDEX = """
+async ([col, target, avgHint, settleMs, maxJumps]) => {
+""" + _JS_RESOLVE_COL + """    const scroller = col && col.querySelector('[data-test-id="virtuoso-scroller"]');
+    if (!scroller) return null;
+    const sel = 'div[data-index="' + target + '"]';
+    const frame = () => new Promise(r => {
+        requestAnimationFrame(() => r());
+        setTimeout(r, 100);
+    });
+    const rendered = () => scroller.querySelectorAll('div[data-index]');
+    const measure = (ws) => {
+        let sum = 0, n = 0;
+        for (const w of ws) {
+            const h = parseFloat(w.getAttribute('data-known-size'))
+                || w.getBoundingClientRect().height;
+            if (h > 0) { sum += h; n++; }
+        }
+        return n ? sum / n : avgHint;
+    };
+    let avg = measure(rendered());
+    for (let jump = 0; jump <= maxJumps; jump++) {
+        const card = scroller.querySelector(sel);
+        if (card) {
+            const top = card.getBoundingClientRect().top - scroller.getBoundingClientRect().top;
+            if (top < 0 || top > scroller.clientHeight - 1) scroller.scrollTop += top;
+            return {found: true, avg: Math.round(avg)};
+        }
+        if (jump === maxJumps) break;
+        const ws = rendered();
+        const first = ws.length ? parseInt(ws[0].getAttribute('data-index'), 10) : NaN;
+        const prevTop = scroller.scrollTop;
+        scroller.scrollTop = jump === 0 || isNaN(first)
+            ? target * avg
+            : Math.max(0, prevTop + (target - first) * avg);
+        if (scroller.scrollTop === prevTop && jump > 0) break;  // pinned at an edge
+        const before = ws.length ? ws[0].getAttribute('data-index') : null;
+        const deadline = performance.now() + settleMs;
+        await frame();
+        await frame();
+        while (performance.now() < deadline && !scroller.querySelector(sel)) {
+            const w = scroller.querySelector('div[data-index]');
+            if (w && w.getAttribute('data-index') !== before) break;
+            await frame();
+        }
+        avg = measure(rendered());
+    }
+    return {found: false, avg: Math.round(avg)};
+}
+"""
+
+# Installs window.__probeFiber / window.__extractCards once per document, with
+# their constant tables built once in the closure instead of per call.
+# Registered with add_init_script and evaluated into the current document.
+_JS_FIBER_HELPERS = """
+(() => {
+    if (window.__probeFiber) return;
+    const ID_RE = /^[A-Za-z0-9]{16,30}$/;
+    const _SKIP_KEYS = new Set(['owner', 'project', 'reviewer', 'labeler', 'createdBy', 'name', 'sourceBatch', 'status', 'instructionsText']);
+    window.__probeFiber = """ + _JS_PROBE_FIBER_FN + """;
+    window.__extractCards = """ + _JS_EXTRACT_FN + """;
+})()
+"""
+
+# Probe call site.  Called with [colHandle].
+_JS_PROBE_FIBER = """
+([col]) => {
+""" + _JS_RESOLVE_COL + """    return window.__probeFiber(col);
+}
+"""
+
+
+# Per-page cache of the Annotating column JSHandle.  A page maps to None until
+# the handle is (re)built; main-frame navigation resets it to None.
+_COL_HANDLES: "weakref.WeakKeyDictionary[Page, JSHandle | None]" = weakref.WeakKeyDictionary()
+
+
+def _get_annotating_col(page: Page) -> JSHandle:
+    """
+    Return a cached JSHandle to the Annotating column element of ``page``.
+
+    Built once with page.evaluate_handle() and reused across scroll/extract
+    calls; invalidated on main-frame navigation.  Scripts receiving it must
+    still re-resolve when ``!col.isConnected`` (React re-render).
+
+    The first call for a page also installs _JS_FIBER_HELPERS.
+    """
+    if page not in _COL_HANDLES:
+        page.add_init_script(_JS_FIBER_HELPERS)
+        page.evaluate(_JS_FIBER_HELPERS)
+        def _invalidate(frame, _page=weakref.ref(page)):
+            p = _page()
+            if p is not None and frame.parent_frame is None:
+                _COL_HANDLES[p] = None
+        page.on("framenavigated", _invalidate)
+        _COL_HANDLES[page] = None
+
+    handle = _COL_HANDLES[page]
+    if handle is None:
+        handle = page.evaluate_handle(_JS_FIND_ANNOTATING_COL)
+        _COL_HANDLES[page] = handle
+    return handle
+
+
+# Playwright error text for a column handle that outlived its element or
+# document.  Only these are retried: any other failure (a JS error thrown by
+# the script itself) would fail again, and a retry would repeat side effects
+# such as a scroll.
+_STALE_HANDLE_ERRORS = (
+    "Execution context was destroyed",
+    "Cannot find context with specified id",
+    "not attached",
+    "disposed",
+)
+
+
+def _evaluate_on_col(page: Page, script: str, *args):
+    """Run ``script`` with [colHandle, *args]; rebuild a stale handle once."""
+    try:
+        return page.evaluate(script, [_get_annotating_col(page), *args])
+    except Exception as e:
+        if not any(marker in str(e) for marker in _STALE_HANDLE_ERRORS):
+            raise
+        _COL_HANDLES[page] = None
+        page.evaluate(_JS_FIBER_HELPERS)  # no-op unless the document lost them
+        return page.evaluate(script, [_get_annotating_col(page), *args])
+
 
 def _probe_fiber_structure(page: Page):
     """
@@ -255,7 +547,7 @@ def _probe_fiber_structure(page: Page):
     Returns dict with {id_key, img_key, fiber_key_hint, sample_id} or None.
     """
     try:
-        result = page.evaluate(_JS_PROBE_FIBER)
+        result = _evaluate_on_col(page, _JS_PROBE_FIBER)
         if result and result.get("id_key"):
             logger.info(
                 f"  [Fiber] Probe OK: id_key={result['id_key']}, "
@@ -263,62 +555,63 @@ def _probe_fiber_structure(page: Page):
                 f"sample_id={result['sample_id']}, "
                 f"keys={result.get('all_keys')}"
             )
-            # Also discover the fiber key string for reuse
-            fiber_key_hint = page.evaluate("""
-                () => {
-                    const col = (() => {
-                        const cols = document.querySelectorAll('.boardColumn');
-                        for (const c of cols) {
-                            const h2 = c.querySelector('h2');
-                            if (h2 && h2.textContent.trim() === 'Annotating') return c;
-                        }
-                        return null;
-                    })();
-                    if (!col) return null;
-                    const card = col.querySelector('div[data-index]');
-                    if (!card) return null;
-                    return Object.keys(card).find(k =>
-                        k.startsWith('__reactFiber$') || k.startsWith('__reactInternalInstance$')
-                    ) || null;
-                }
-            """)
-            result["fiber_key_hint"] = fiber_key_hint
             return result
         logger.debug("  [Fiber] Probe returned no id_key")
         return None
     except Exception as e:
-        logger.debug(f"  [Fiber] Probe error: {e}")
+        logger.debug("  [Fiber] Probe error: %s", e)
         return None
 
 
-def _extract_visible_cards(page: Page, id_key: str, img_key, fiber_key_hint=None) -> list:
+def _scroll_and_extract_cards(
+    page: Page, step: int, id_key: str, img_key, fiber_key_hint=None,
+) -> tuple:
     """
-    Extract job data from all currently rendered cards via React fiber.
+    Scroll the Annotating list by ``step`` px, let Virtuoso settle, and
+    extract job data from all rendered cards via React fiber — one evaluate.
+    Requires _install_filter_sets() for the current batch.
 
-    Returns list of {index: int, job_id: str, img_count: int}.
+    Returns (indices, job_urls, skips, at_end): three parallel lists (skips
+    holds a _SKIP_* code per card); at_end is True when the list cannot
+    scroll further in the step direction.
     """
     try:
-        return page.evaluate(
-            _JS_EXTRACT_CARDS,
-            [id_key, img_key, fiber_key_hint],
+        result = _evaluate_on_col(
+            page, _JS_SCROLL_AND_EXTRACT,
+            step, id_key, img_key, fiber_key_hint, _SCROLL_SETTLE_MS,
         )
+        cards = result["cards"]
+        return cards["indices"], cards["urls"], cards["skips"], result["atEnd"]
     except Exception as e:
-        logger.debug(f"  [Fiber] Extract error: {e}")
-        return []
+        logger.debug("  [Fiber] Extract error: %s", e)
+        return [], [], [], False
+
+
+def _install_filter_sets(
+    page: Page, base_job_url: str, min_images: int, done, held, blacklist,
+) -> None:
+    """Ship this batch's URL filters to the page once, as JS Sets."""
+    page.evaluate(
+        _JS_INSTALL_FILTER_SETS,
+        [base_job_url, min_images, list(done), list(held), list(blacklist)],
+    )
 
 
 # =================================================================================
-#  Tier 0: Firestore fetch() Intercept (JS monkey-patch)
+#  Tier 0: Firestore Request Intercept (network-layer request listener)
 # =================================================================================
 
 def _install_firestore_intercept(page: Page, config: dict) -> None:
     """
-    Install the fetch() monkey-patch and expose_function once per page lifetime.
+    Attach a passive "request" listener once per page lifetime.
     Stores captured job IDs in config["_firestore_ids"] (a shared set cleared
-    each batch by _network_collect_urls).
+    each batch by _network_collect_urls) and the monotonic time of the latest
+    new ID in config["_firestore_last_capture"].
 
-    Must be called BEFORE any navigation so add_init_script fires on every
-    subsequent page load, including the reload Tier 0 triggers.
+    The listener reads POST bodies to firestore.googleapis.com as raw bytes
+    (fetch or XHR, any transport) and scans them with _FIRESTORE_JOB_RE_BYTES —
+    no page-side script, no exposed function.  Unlike page.route() it never
+    holds the request, so the sync driver being busy cannot stall the page.
     """
     if config.get("_firestore_intercept_installed"):
         return
@@ -326,16 +619,27 @@ def _install_firestore_intercept(page: Page, config: dict) -> None:
     captured: set[str] = set()
     config["_firestore_ids"] = captured
 
-    def _py_capture(job_id: str) -> None:
-        captured.add(job_id)
+    def _on_request(request) -> None:
+        if request.method != "POST" or _FIRESTORE_HOST not in request.url:
+            return
+        try:
+            body = request.post_data_buffer
+        except Exception:
+            return
+        if body and b"annotation_jobs" in body:
+            before = len(captured)
+            captured.update(
+                m.group(1).decode("ascii") for m in _FIRESTORE_JOB_RE_BYTES.finditer(body)
+            )
+            if len(captured) != before:
+                config["_firestore_last_capture"] = time.monotonic()
 
     try:
-        page.expose_function("_pyFirestoreCapture", _py_capture)
-        page.add_init_script(_JS_FIRESTORE_FETCH_PATCH)
+        page.on("request", _on_request)
         config["_firestore_intercept_installed"] = True
-        logger.info("  [Tier0] Firestore fetch() intercept installed")
+        logger.info("  [Tier0] Firestore request intercept installed")
     except Exception as e:
-        logger.warning(f"  [Tier0] Failed to install fetch intercept: {e}")
+        logger.warning(f"  [Tier0] Failed to install request intercept: {e}")
 
 
 def _network_collect_urls(
@@ -347,6 +651,8 @@ def _network_collect_urls(
     config=None,
     coord_held: set | None = None,
     coord_done: set | None = None,
+    *,
+    reload: bool = True,
 ) -> list | None:
     """
     Tier 0: Collect job URLs by intercepting Firestore subscription POST request bodies.
@@ -356,73 +662,96 @@ def _network_collect_urls(
         datasets/{datasetId}/annotation_jobs/{jobId}/timeline
 
     No DOM access, no scrolling, no clicks required.  Requires a page reload to
-    trigger fresh subscription bursts.
+    trigger fresh subscription bursts.  When no ID arrives within
+    _TIER0_FIRST_ID_S the caller moves on to Tier 1; the listener keeps
+    capturing during Tier 1's page waits, and ``reload=False`` then filters
+    whatever it caught without reloading or waiting (the second look after a
+    failed Tier 1).
 
     Returns a list of job URLs, or None if disabled / nothing captured.
     """
     if config and not config.get("use_network_tier0", True):
-        logger.info("  [Tier0] Disabled via config — skipping")
+        if reload:
+            logger.info("  [Tier0] Disabled via config — skipping")
         return None
 
     captured_ids: set[str] | None = config.get("_firestore_ids") if config else None
     if captured_ids is None:
-        logger.warning("  [Tier0] Intercept not installed — skipping (call _install_firestore_intercept first)")
+        if reload:
+            logger.warning("  [Tier0] Intercept not installed — skipping (call _install_firestore_intercept first)")
         return None
 
-    # Clear IDs from previous batch, then reload to trigger fresh fetch() calls
+    if not reload:
+        if not captured_ids:
+            return None
+        logger.info("  [Tier0] Late capture during Tier 1 — using intercepted IDs")
+        return _filter_captured_ids(captured_ids, count, blacklist, annotate_url, coord_held, coord_done)
+
+    # Clear IDs from previous batch, then reload to trigger fresh subscription POSTs
     captured_ids.clear()
 
-    logger.info("  [Tier0] Reloading page to trigger Firestore fetch() calls …")
+    logger.info("  [Tier0] Reloading page to trigger Firestore subscription requests …")
     try:
         page.reload(wait_until=WAIT_STRATEGY, timeout=NAV_TIMEOUT)
     except Exception as e:
         logger.warning(f"  [Tier0] Reload failed: {e}")
         return None
 
-    # Wait up to 8 s; exit early when counts stabilise (2 s stable + ≥1 result)
-    deadline = time.time() + 8.0
-    last_count, stable_ticks = 0, 0
-    while time.time() < deadline:
-        time.sleep(0.5)
-        current = len(captured_ids)
-        if current == last_count:
-            stable_ticks += 1
-            if stable_ticks >= 4 and current > 0:
+    # Wait up to 8 s; exit as soon as 2 s pass with no new ID (≥1 result),
+    # or after _TIER0_FIRST_ID_S with nothing at all.
+    # The listener stamps each new ID, so we sleep straight to the end of the
+    # current quiet window instead of polling the count.  page.wait_for_timeout
+    # (not time.sleep) keeps Playwright's dispatcher running, so "request"
+    # events land while we wait.
+    quiet_s = 2.0
+    started = time.monotonic()
+    deadline = started + 8.0
+    while True:
+        now = time.monotonic()
+        if now >= deadline:
+            break
+        if not captured_ids and now >= started + _TIER0_FIRST_ID_S:
+            break
+        if captured_ids:
+            quiet_until = config.get("_firestore_last_capture", now) + quiet_s
+            if now >= quiet_until:
                 break
+            wake = min(quiet_until, deadline)
         else:
-            stable_ticks = 0
-            last_count = current
+            wake = min(now + 0.25, deadline)  # nothing yet — watch for the first ID
+        page.wait_for_timeout(max(1, int((wake - now) * 1000)))
 
     if not captured_ids:
-        logger.info("  [Tier0] No job IDs captured via fetch() intercept")
+        logger.info("  [Tier0] No job IDs captured via request intercept")
         return None
 
+    return _filter_captured_ids(captured_ids, count, blacklist, annotate_url, coord_held, coord_done)
+
+
+def _filter_captured_ids(
+    captured_ids: set, count: int, blacklist: set, annotate_url: str,
+    coord_held: set | None, coord_done: set | None,
+) -> list:
+    """Turn Tier 0 job IDs into at most ``count`` usable job URLs."""
+    # Filter with whole-set operations (one C-level pass per filter set)
+    # instead of three Python-level membership tests per captured ID.
     base_job_url = annotate_url.rstrip("/") + "/job/"
-    urls: list[str] = []
-    _held = coord_held or set()
-    _done = coord_done or set()
-    skip_held = skip_done = skip_bl = 0
-    for job_id in captured_ids:
-        job_url = base_job_url + job_id
-        if job_url in _done:
-            skip_done += 1
-            continue
-        if job_url in _held:
-            skip_held += 1
-            continue
-        if job_url in blacklist:
-            skip_bl += 1
-            continue
-        urls.append(job_url)
-        if len(urls) >= count:
-            break
+    candidates = {base_job_url + job_id for job_id in captured_ids}
+    skipped_done = candidates.intersection(coord_done or ())
+    candidates -= skipped_done
+    skipped_held = candidates.intersection(coord_held or ())
+    candidates -= skipped_held
+    skipped_bl = candidates.intersection(blacklist)
+    candidates -= skipped_bl
+    urls: list[str] = list(itertools.islice(candidates, count))
+    skip_held, skip_done, skip_bl = len(skipped_held), len(skipped_done), len(skipped_bl)
 
     parts = [f"{len(urls)} usable"]
     if skip_held: parts.append(f"{skip_held} held by other workers")
     if skip_done: parts.append(f"{skip_done} already done")
     if skip_bl:   parts.append(f"{skip_bl} blacklisted")
     logger.info(
-        f"  [Tier0] Captured {len(captured_ids)} job IDs via fetch() intercept → "
+        f"  [Tier0] Captured {len(captured_ids)} job IDs via request intercept → "
         + ", ".join(parts)
     )
     return urls  # [] when all filtered out; caller uses 'is not None' to detect success
@@ -464,83 +793,87 @@ def _bulk_collect_urls(
     # annotate_url looks like: .../project-name/annotate
     base_job_url = annotate_url.rstrip("/") + "/job/"
 
-    annotating_col = page.locator(_ANNOTATING_COL)
-    scroller = annotating_col.locator(_VIRTUOSO).first
-
-    urls = []
+    urls: dict = {}  # insertion-ordered; O(1) duplicate check
     seen_indices = set()
     stall_count = 0
     MAX_STALL = 5  # stop if 5 consecutive scroll steps yield no new cards
     _skip_held = _skip_done = _skip_bl = 0
 
+    try:
+        _install_filter_sets(
+            page, base_job_url, min_images if img_key else 0,
+            coord_done or (), coord_held or (), blacklist,
+        )
+    except Exception as e:
+        logger.info("  [Bulk] Could not install filter sets (%s) — falling back to click-per-card", e)
+        return None
+
     start_time = time.time()
 
-    # Initial scroll position
-    if direction == "bottom_up":
-        scroller.evaluate("e => { e.scrollTop = e.scrollHeight; }")
-    else:
-        scroller.evaluate("e => { e.scrollTop = 0; }")
+    # Initial scroll position — constant script on the cached column handle
+    try:
+        positioned = _evaluate_on_col(page, _JS_SCROLL_TO_EDGE, direction == "bottom_up")
+    except Exception:
+        positioned = False
+    if not positioned:
+        logger.info("  [Bulk] Board scroller not found — falling back to click-per-card")
+        return None
 
     # Wait for Virtuoso to render at least one card before starting the extraction loop.
     # A bare sleep(0.5) races with the DOM — especially after Tier 0's page reload.
+    # React attaches the fiber before inserting the node, so no extra settle is needed.
     try:
-        page.wait_for_selector(
-            f'{_ANNOTATING_COL} div[data-index]',
-            state="visible",
-            timeout=10_000,
-        )
+        rendered = page.evaluate(_JS_WAIT_FOR_CARDS, 10_000)
     except Exception:
+        rendered = False
+    if not rendered:
         logger.warning("  [Bulk] Timed out waiting for cards to render — aborting fiber extraction")
         return None
-    time.sleep(0.2)  # brief extra stabilisation after first card appears
+
+    # First pass extracts in place; every later pass scrolls one step first.
+    step = 0
+    scroll_step = -_SCROLL_STEP_PX if direction == "bottom_up" else _SCROLL_STEP_PX
 
     while len(urls) < count and stall_count < MAX_STALL:
-        cards = _extract_visible_cards(page, id_key, img_key, fiber_hint)
-        new_cards = [c for c in cards if c["index"] not in seen_indices]
+        indices, job_urls, skips, at_end = _scroll_and_extract_cards(
+            page, step, id_key, img_key, fiber_hint,
+        )
+        step = scroll_step
+        new_cards = [
+            (idx, job_url, skip)
+            for idx, job_url, skip in zip(indices, job_urls, skips)
+            if idx not in seen_indices
+        ]
 
         if not new_cards:
+            if at_end:
+                break  # list exhausted — no point burning stall rounds
             stall_count += 1
         else:
             stall_count = 0
 
-        # Process in order appropriate for direction
-        if direction == "bottom_up":
-            new_cards.sort(key=lambda c: c["index"], reverse=True)
-        else:
-            new_cards.sort(key=lambda c: c["index"])
-
-        for card in new_cards:
-            seen_indices.add(card["index"])
+        # Process in order appropriate for direction (tuples sort by index)
+        new_cards.sort(reverse=(direction == "bottom_up"))
 
-            # Image count filter (skip if img_key unavailable — accept all)
-            if img_key and card["img_count"] >= 0 and card["img_count"] < min_images:
-                continue
-
-            job_url = base_job_url + card["job_id"]
-            _done = coord_done or set()
-            _held = coord_held or set()
-
-            # Done filter — already completed by any worker
-            if job_url in _done:
-                _skip_done += 1
-                continue
+        for idx, job_url, skip in new_cards:
+            seen_indices.add(idx)
 
-            # Held filter — claimed by another worker
-            if job_url in _held:
-                _skip_held += 1
-                continue
-
-            # Blacklist filter (P3) — locally failed
-            if job_url in blacklist:
-                _skip_bl += 1
+            # Image count / done / held / blacklist filters ran page-side
+            if skip:
+                if skip == _SKIP_DONE:
+                    _skip_done += 1       # already completed by any worker
+                elif skip == _SKIP_HELD:
+                    _skip_held += 1       # claimed by another worker
+                elif skip == _SKIP_BLACKLIST:
+                    _skip_bl += 1         # locally failed (P3)
                 continue
 
             # Duplicate filter
             if job_url in urls:
                 continue
 
-            urls.append(job_url)
-            logger.debug(f"  [Bulk] idx={card['index']} → {job_url[-30:]}")
+            urls[job_url] = None
+            logger.debug("  [Bulk] idx=%s → %s", idx, job_url[-30:])
 
             if len(urls) >= count:
                 break
@@ -548,13 +881,6 @@ def _bulk_collect_urls(
         if len(urls) >= count:
             break
 
-        # Scroll to next viewport
-        if direction == "bottom_up":
-            scroller.evaluate(f"e => {{ e.scrollTop = Math.max(0, e.scrollTop - {_SCROLL_STEP_PX}); }}")
-        else:
-            scroller.evaluate(f"e => {{ e.scrollTop += {_SCROLL_STEP_PX}; }}")
-        time.sleep(0.4)
-
     elapsed = time.time() - start_time
     parts = [f"{len(urls)} usable"]
     if _skip_held: parts.append(f"{_skip_held} held by other workers")
@@ -564,7 +890,7 @@ def _bulk_collect_urls(
         f"  [Bulk] {', '.join(parts)} via fiber extraction "
         f"in {elapsed:.1f}s (scanned {len(seen_indices)} cards)"
     )
-    return urls  # [] when all filtered by coordination; caller uses 'is not None'
+    return list(urls)  # [] when all filtered by coordination; caller uses 'is not None'
 
 
 def _fast_navigate_back(page: Page, annotate_url: str) -> None:
@@ -579,7 +905,7 @@ def _fast_navigate_back(page: Page, annotate_url: str) -> None:
         page.go_back(wait_until=WAIT_STRATEGY, timeout=15_000)
         current = page.url
         # Verify we landed on the board, not still on a job detail page
-        if "/annotate/job/" not in current and "/annotate" in current:
+        if not _ANNOTATE_JOB_URL_RE.search(current) and "/annotate" in current:
             # Wait for the Virtuoso scroller (not just the column) so React has
             # re-hydrated before any subsequent scroller.evaluate() call.
             page.wait_for_selector(
@@ -602,6 +928,28 @@ def _fast_navigate_back(page: Page, annotate_url: str) -> None:
         pass
 
 
+# Per-context set of open pages, maintained by "page"/"close" events so
+# _close_stray_popups never has to walk context.pages.
+_OPEN_PAGES: "weakref.WeakKeyDictionary[BrowserContext, set]" = weakref.WeakKeyDictionary()
+
+
+def _tracked_pages(context: BrowserContext) -> set:
+    """Return the live open-page set for ``context``, seeding it on first use."""
+    pages = _OPEN_PAGES.get(context)
+    if pages is None:
+        pages = set()
+
+        def _track(p: Page) -> None:
+            pages.add(p)
+            p.on("close", lambda closed: pages.discard(closed))
+
+        for p in context.pages:
+            _track(p)
+        context.on("page", _track)
+        _OPEN_PAGES[context] = pages
+    return pages
+
+
 def _close_stray_popups(page: Page) -> None:
     """Close any extra tabs that were opened as popups during card clicks.
 
@@ -609,13 +957,16 @@ def _close_stray_popups(page: Page) -> None:
     Silently ignores already-closed pages.
     """
     try:
-        main_page = page
-        for p in page.context.pages:
-            if p != main_page and not p.is_closed():
-                try:
+        pages = _tracked_pages(page.context)
+        if len(pages) <= 1:
+            return
+        for p in [p for p in pages if p != page]:
+            try:
+                if not p.is_closed():
                     p.close()
-                except Exception:
-                    pass
+            except Exception:
+                pass
+            pages.discard(p)
     except Exception:
         pass
 
@@ -630,45 +981,51 @@ def _click_card_and_get_url(page: Page, card_element, annotate_url: str) -> str
     Returns the job URL string, or None if the click produced nothing useful.
     The board page is always left in a usable state.
     """
-    pages_before = set(page.context.pages)
+    # New tabs are pushed by the context "page" event — no polling of
+    # context.pages.  wait_for_timeout keeps Playwright's dispatcher running
+    # so both the event and page.url updates arrive while we wait.
+    context = page.context
+    opened: list = []
+    on_page = opened.append
+    context.on("page", on_page)
+    try:
+        # Click the card
+        card_element.click()
 
-    # Click the card
-    card_element.click()
+        # Wait up to 5 s for either a new tab or a URL change
+        deadline = time.time() + 5.0
+        while not opened and not _ANNOTATE_JOB_URL_RE.search(page.url) and time.time() < deadline:
+            page.wait_for_timeout(50)
+    finally:
+        context.remove_listener("page", on_page)
 
-    # Wait briefly for either a new tab or a URL change
     job_url = None
 
     # ── Check A: did a new tab appear? ────────────────────────────────
-    # Poll for up to 5 seconds for a popup
-    for _ in range(10):
-        time.sleep(0.5)
-        pages_now = set(page.context.pages)
-        new_pages = [p for p in pages_now - pages_before if not p.is_closed()]
-        if new_pages:
-            popup = new_pages[0]
+    new_pages = [p for p in opened if not p.is_closed()]
+    if new_pages:
+        popup = new_pages[0]
+        try:
+            popup.wait_for_load_state("commit", timeout=10_000)
+        except Exception:
+            pass
+        job_url = popup.url
+        # Close all new tabs
+        for p in new_pages:
             try:
-                popup.wait_for_load_state("commit", timeout=10_000)
+                if not p.is_closed():
+                    p.close()
             except Exception:
                 pass
-            job_url = popup.url
-            # Close all new tabs
-            for p in new_pages:
-                try:
-                    if not p.is_closed():
-                        p.close()
-                except Exception:
-                    pass
-            break
 
-        # ── Check B: did the current page navigate away? ──────────────
-        if "/annotate/job/" in page.url:
-            job_url = page.url
-            _fast_navigate_back(page, annotate_url)
-            break
+    # ── Check B: did the current page navigate away? ──────────────────
+    elif _ANNOTATE_JOB_URL_RE.search(page.url):
+        job_url = page.url
+        _fast_navigate_back(page, annotate_url)
 
     # Fallback: if neither happened after 5s, one more check
     if job_url is None:
-        if "/annotate/job/" in page.url:
+        if _ANNOTATE_JOB_URL_RE.search(page.url):
             job_url = page.url
             _fast_navigate_back(page, annotate_url)
         else:
@@ -676,15 +1033,143 @@ def _click_card_and_get_url(page: Page, card_element, annotate_url: str) -> str
             _close_stray_popups(page)
 
     # Validate: must be an annotate/job URL
-    if job_url and "/annotate/job/" in job_url:
+    if job_url and _ANNOTATE_JOB_URL_RE.search(job_url):
         return job_url
 
-    logger.debug(f"  _click_card_and_get_url: no valid job URL obtained (got {job_url})")
+    logger.debug("  _click_card_and_get_url: no valid job URL obtained (got %s)", job_url)
     return None
 
 
 # ── Shared helpers for Tier 2 click-per-card ────────────────────────────────
 
+# One pass over every rendered card of the Annotating column:
+# [[data-index, job href | null, image count], ...].  The href is the card's
+# own /annotate/job/ anchor (origin + path) when the markup has one.
+_JS_HARVEST_VISIBLE_CARDS = """
+([col]) => {
+""" + _JS_RESOLVE_COL + """
+    if (!col) return [];
+    const IMAGES_RE = /(\\d+)\\s+Images/;
+    const out = [];
+    for (const w of col.querySelectorAll('div[data-index]')) {
+        const idx = parseInt(w.getAttribute('data-index'), 10);
+        if (isNaN(idx)) continue;
+        const a = w.querySelector('a[href*="/annotate/job/"]');
+        const card = w.querySelector('.AnnotationJobCard');
+        const p = card && card.querySelector('p.text-xs.font-semibold.text-gray-700');
+        const m = p && IMAGES_RE.exec(p.textContent || '');
+        out.push([idx, a ? a.origin + a.pathname : null, m ? parseInt(m[1], 10) : 0]);
+    }
+    return out;
+}
+"""
+
+
+# _JS_SCROLL_TO_INDEX followed by _JS_HARVEST_VISIBLE_CARDS in the same
+# evaluate: {found, avg, cards} (cards only when found), or null.
+_JS_SCROLL_AND_HARVEST = """
+async (args) => {
+    const r = await (""" + _JS_SCROLL_TO_INDEX + """)(args);
+    if (r && r.found) r.cards = (""" + _JS_HARVEST_VISIBLE_CARDS + """)(args);
+    return r;
+}
+"""
+
+
+# _JS_SCROLL_TO_INDEX followed, when found, by _JS_WAIT_SCROLL_SETTLED (up to
+# 1 s) in the same evaluate — the click path's scroll + settle in one call.
+_JS_SCROLL_AND_SETTLE = """
+async (args) => {
+    const r = await (""" + _JS_SCROLL_TO_INDEX + """)(args);
+    if (r && r.found) await (""" + _JS_WAIT_SCROLL_SETTLED + """)([args[0], 1000]);
+    return r;
+}
+"""
+
+
+def _wait_scroll_settled(page: Page, timeout_ms: int = 2_000) -> bool:
+    """Wait for the Annotating scroller to stop moving (see _JS_WAIT_SCROLL_SETTLED)."""
+    try:
+        return bool(_evaluate_on_col(page, _JS_WAIT_SCROLL_SETTLED, timeout_ms))
+    except Exception as e:
+        logger.debug("  _wait_scroll_settled error: %s", e)
+        return False
+
+
+def _harvest_card(page: Page, data_index: int, harvested: dict, config=None):
+    """
+    (job_url | None, image_count) for ``data_index``, or None if unreachable.
+
+    Scrolls and harvests (one evaluate) only when the index is outside every
+    window seen so far, so a card skipped on image count or on its anchor URL
+    costs no Playwright call of its own.
+    """
+    hit = harvested.get(data_index)
+    if hit is None:
+        if _scroll_to_card(page, data_index, config=config, harvest=harvested) is None:
+            return None
+        hit = harvested.get(data_index, (None, 0))
+    return hit
+
+
+def _skip_reasons(coord_done, coord_held, blacklist) -> dict:
+    """One {url: reason} lookup for the P3 skip checks (done > held > blacklisted)."""
+    reasons = dict.fromkeys(blacklist, "blacklisted")
+    reasons.update(dict.fromkeys(coord_held or (), "held-by-other"))
+    reasons.update(dict.fromkeys(coord_done or (), "already-done"))
+    return reasons
+
+
+def _tier2_card_verdict(
+    page: Page, data_index: int, *, harvested: dict, skip_reasons: dict, urls: dict,
+    min_images: int, annotate_url: str, config=None, tag: str = "",
+) -> tuple:
+    """
+    Classify one Tier 2 card: (verdict, job_url).
+
+    "unreachable" — not rendered after scrolling (job_url None)
+    "pass"        — too few images, or no URL could be extracted
+    "skip"        — done / held / blacklisted / duplicate (counts toward convergence)
+    "collect"     — new usable job URL
+
+    Logs the reason, so the driver loops only step their index.
+    """
+    hit = _harvest_card(page, data_index, harvested, config)
+    if hit is None:
+        return "unreachable", None
+
+    job_url, img_count = hit
+    if img_count < min_images:
+        logger.info("  %sSkipping index %s: %s images (< %s)", tag, data_index, img_count, min_images)
+        return "pass", None
+
+    logger.info("  %sProcessing index %s: %s images", tag, data_index, img_count)
+
+    # Click card -> detect new tab or SPA nav -> extract URL
+    if job_url is None:
+        job_url = _click_harvested_card(page, data_index, annotate_url, config)
+    if job_url is None:
+        logger.warning(f"  {tag}Could not extract URL from index {data_index}. Skipping.")
+        return "pass", None
+
+    # P3: differentiated skip checks — one lookup, reason on hit only
+    reason = skip_reasons.get(job_url)
+    if reason is not None:
+        logger.info("  %sSkipping %s URL: %s", tag, reason, job_url[-30:])
+        return "skip", job_url
+    if job_url in urls:
+        logger.warning(f"  {tag}Duplicate URL, skipping: {job_url[-30:]}")
+        return "skip", job_url
+    return "collect", job_url
+
+
+def _click_harvested_card(page: Page, data_index: int, annotate_url: str, config=None) -> str | None:
+    """Click-through for a card whose markup carries no job anchor."""
+    card_wrapper = _scroll_to_card(page, data_index, config=config, settle=True)
+    if card_wrapper is None:
+        return None
+    return _click_card_and_get_url(page, card_wrapper.locator(".AnnotationJobCard").first, annotate_url)
+
 
 def _dismiss_detail_overlay(page: Page) -> None:
     """Dismiss a lingering .AnnotationJobDetailView overlay that covers the board.
@@ -714,74 +1199,85 @@ def _dismiss_detail_overlay(page: Page) -> None:
 
 def _scroll_to_card(
     page: Page,
-    scroller,
-    annotating_col,
     data_index: int,
     *,
     avg_card_height: int = 150,
+    config=None,
+    harvest: dict | None = None,
+    settle: bool = False,
 ) -> "Locator | None":
     """Scroll the Virtuoso scroller so that ``div[data-index="N"]`` is rendered.
 
-    1. Estimate scrollTop = data_index * avg_card_height.
-    2. Set scrollTop, wait up to 2 s for the card to appear in the DOM.
-    3. If not found, nudge ±400 px up to 5 times.
+    Runs _JS_SCROLL_TO_INDEX in one evaluate against the cached column handle
+    (_get_annotating_col, invalidated on navigation): jump to data_index * avg
+    height, then correct from the first rendered index using the measured card
+    height (up to _SCROLL_TO_INDEX_JUMPS jumps).  The measured height is cached
+    in config["_avg_card_h"] when a config dict is given.
+
+    A page.evaluate does not auto-wait, so a scroller React has not yet
+    re-hydrated after SPA navigation + back returns None at once instead of
+    hanging on a locator timeout.
+
+    With a ``harvest`` dict the same evaluate also reads every rendered card
+    (_JS_SCROLL_AND_HARVEST) and merges {data_index: (href | None, images)}
+    into it.  With ``settle`` it instead waits, still inside that evaluate,
+    for the scroller to come to rest (_JS_SCROLL_AND_SETTLE) before a click.
 
     Returns the card wrapper Locator if found, else None.
     """
-    selector = f'div[data-index="{data_index}"]'
-    estimated_top = data_index * avg_card_height
+    if config is not None:
+        avg_card_height = config.get("_avg_card_h", avg_card_height)
 
-    # Health-check: verify scroller is interactive before attempting scroll.
-    # Avoids a 60 s Playwright default-timeout hang when React hasn't yet
-    # re-hydrated the Virtuoso scroller after SPA navigation + back.
     try:
-        scroller.evaluate("e => e.scrollHeight", timeout=5_000)
-    except Exception:
-        logger.debug(
-            f"  _scroll_to_card: scroller not interactive for index {data_index} "
-            "(5s health-check failed)"
+        result = _evaluate_on_col(
+            page,
+            _JS_SCROLL_AND_HARVEST if harvest is not None
+            else _JS_SCROLL_AND_SETTLE if settle
+            else _JS_SCROLL_TO_INDEX,
+            data_index, avg_card_height, _SCROLL_SETTLE_MS, _SCROLL_TO_INDEX_JUMPS,
         )
+    except Exception as e:
+        logger.debug("  _scroll_to_card: scroll error for index %s: %s", data_index, e)
         return None
 
-    # Jump to estimated position and give Virtuoso a tick to reconcile.
-    # Without the sleep, React's virtualizer may not have rendered the target
-    # div yet on slower machines, causing spurious "End of list" warnings.
-    scroller.evaluate(f"e => {{ e.scrollTop = {estimated_top}; }}")
-    time.sleep(0.3)
-    try:
-        annotating_col.locator(selector).first.wait_for(state="attached", timeout=3_000)
-        card = annotating_col.locator(selector).first
-        if card.is_visible(timeout=500):
-            return card
-    except Exception:
-        pass
+    if result is None:
+        logger.debug("  _scroll_to_card: scroller not rendered for index %s", data_index)
+        return None
 
-    # Nudge search: alternate smaller offsets around estimated position
-    nudges = [-400, 400, -800, 800, -1200]
-    for nudge in nudges:
-        target = max(0, estimated_top + nudge)
-        scroller.evaluate(f"e => {{ e.scrollTop = {target}; }}")
-        time.sleep(0.5)
-        try:
-            annotating_col.locator(selector).first.wait_for(state="attached", timeout=2_000)
-            card = annotating_col.locator(selector).first
-            if card.is_visible(timeout=500):
-                return card
-        except Exception:
-            continue
+    if config is not None and result.get("avg"):
+        config["_avg_card_h"] = result["avg"]
+
+    if result.get("found"):
+        if harvest is not None:
+            harvest.update((idx, (href, img)) for idx, href, img in result["cards"])
+        return page.locator(_ANNOTATING_COL).locator(f'div[data-index="{data_index}"]').first
 
-    logger.debug(f"  _scroll_to_card: index {data_index} not reachable after nudges")
+    logger.debug("  _scroll_to_card: index %s not reachable after %s jumps", data_index, _SCROLL_TO_INDEX_JUMPS)
     return None
 
 
+@functools.lru_cache(maxsize=256)
+def _job_timeouts(image_count: int, multiplier: float) -> tuple:
+    """(add_dataset_ms, stall_s) for one job size — computed once per size.
+
+    Keyed on the multiplier value rather than the config dict, so a config
+    edit or a recycled dict id can never serve a stale entry.
+    """
+    cfg = {"timeout_multiplier": multiplier}
+    return (
+        adaptive_timeout(30_000, image_count, 50, cfg),
+        adaptive_timeout(60_000, image_count, 20, cfg) / 1000.0,
+    )
+
+
 def _add_dataset_timeout(image_count: int, config: dict) -> int:
     """Add-to-dataset button wait: base 30s, +50ms per image."""
-    return adaptive_timeout(30_000, image_count, 50, config)
+    return _job_timeouts(image_count, config.get("timeout_multiplier", 1.0))[0]
 
 
 def _stall_timeout_s(image_count: int, config: dict) -> float:
     """Null conversion stall detector: base 60s, +0.02s per image. Returns seconds."""
-    return adaptive_timeout(60_000, image_count, 20, config) / 1000.0
+    return _job_timeouts(image_count, config.get("timeout_multiplier", 1.0))[1]
 
 
 # =================================================================================
@@ -851,10 +1347,66 @@ def _retry_with_escalation(
 #  Helper Functions
 # =================================================================================
 
+# Poll the Annotating header span in-page until its text has held still for
+# stableMs — with a digit in it, or absent altogether.  Args [timeoutMs,
+# stableMs].  Resolves the trimmed text (null when no span) at the end.
+_JS_READ_JOB_COUNT_HEADER = """
+async ([timeoutMs, stableMs]) => {
+    const read = () => {
+        const col = (() => {""" + _JS_ANNOTATING_COL_LOOKUP + """})();
+        const span = col && col.querySelector(':scope > div > span.font-mono');
+        return span && span.getClientRects().length ? (span.textContent || '').trim() : null;
+    };
+    const deadline = performance.now() + timeoutMs;
+    let last = read(), since = performance.now();
+    while (performance.now() < deadline) {
+        await new Promise(r => setTimeout(r, 100));
+        const t = read();
+        if (t !== last) { last = t; since = performance.now(); continue; }
+        if ((t === null || /\\d/.test(t)) && performance.now() - since >= stableMs) break;
+    }
+    return last;
+}
+"""
+
+
+def _read_annotating_header(page: Page, timeout_ms: int = 10_000) -> str | None:
+    """Settled text of the Annotating header count span, in one evaluate."""
+    return page.evaluate(_JS_READ_JOB_COUNT_HEADER, [timeout_ms, 500])
+
+
+# Per-page time of the last Tier 0 / Tier 1 miss (returned None).  A retry
+# within _TIER_MISS_TTL_S on the same board document goes straight past that
+# tier instead of paying its reload / fiber probe again; a new document
+# (e.g. _go_to_board's reload) clears the page's misses, so a freshly loaded
+# board gets the fast tiers again.  Only misses are
+# remembered — URL lists are not, since coordination state moves on.
+_TIER_MISS_TTL_S = 30.0
+_TIER_MISSES: "weakref.WeakKeyDictionary[Page, dict]" = weakref.WeakKeyDictionary()
+
+
+def _tier_recently_missed(page: Page, tier: str) -> bool:
+    missed_at = _TIER_MISSES.get(page, {}).get(tier)
+    if missed_at is None or time.monotonic() - missed_at >= _TIER_MISS_TTL_S:
+        return False
+    logger.info("  [%s] Missed on this page %.0fs ago — skipping", tier, time.monotonic() - missed_at)
+    return True
+
+
+def _note_tier_miss(page: Page, tier: str) -> None:
+    misses = _TIER_MISSES.get(page)
+    if misses is None:
+        misses = _TIER_MISSES[page] = {}
+        # "domcontentloaded", not "framenavigated": the latter also fires on
+        # the board's own pushState navigations while Tier 2 clicks cards.
+        page.on("domcontentloaded", lambda _page: misses.clear())
+    misses[tier] = time.monotonic()
+
+
 def get_job_count(page: Page) -> int:
     """Parse job count from the Annotating column header.
 
-    Strategy 1: Read the span.font-mono text (fast, precise).
+    Strategy 1: Read the span.font-mono text once it has settled (one evaluate).
     Strategy 2: Count visible AnnotationJobCard elements (fallback).
     """
     try:
@@ -865,39 +1417,28 @@ def get_job_count(page: Page) -> int:
         capture_diagnostics(page, "annotating_column_not_found")
         return 0
 
-    time.sleep(2)  # let header values settle
-
     # Strategy 1: header span
     try:
-        count_el = col.locator("> div > span.font-mono").first
-        if count_el.count() > 0 and count_el.is_visible():
-            try:
-                page.wait_for_function(
-                    "(el) => { const t = (el.textContent || '').trim(); return /\\d/.test(t); }",
-                    count_el,
-                    timeout=10_000,
-                )
-            except Exception:
-                logger.debug("  Header span not hydrated with digits within timeout")
-            text = count_el.inner_text().strip()
-            match = re.search(r"(\d+)", text)
+        text = _read_annotating_header(page)
+        if text is not None:
+            match = _RE_DIGIT.search(text)
             if match:
                 count = int(match.group(1))
-                logger.info(f"Annotating column: {count} Jobs (header span)")
+                logger.info("Annotating column: %s Jobs (header span)", count)
                 return count
-            logger.debug(f"  Header span text had no number: '{text}'")
+            logger.debug("  Header span text had no number: '%s'", text)
     except Exception as e:
-        logger.debug(f"  Strategy 1 (header span) failed: {e}")
+        logger.debug("  Strategy 1 (header span) failed: %s", e)
 
     # Strategy 2: count card elements
     try:
         cards = page.locator(f"{_ANNOTATING_COL} .AnnotationJobCard")
         card_count = cards.count()
         if card_count > 0:
-            logger.info(f"Annotating column: {card_count}+ Jobs (card count)")
+            logger.info("Annotating column: %s+ Jobs (card count)", card_count)
             return card_count
     except Exception as e:
-        logger.debug(f"  Strategy 2 (card count) failed: {e}")
+        logger.debug("  Strategy 2 (card count) failed: %s", e)
 
     logger.warning("Could not determine job count from the Annotating column.")
     return 0
@@ -918,7 +1459,8 @@ def collect_job_urls(
     Collect job URLs top-down using virtual scrolling.
 
     Tier 1: React fiber bulk extraction (no clicking, ~seconds).
-    Tier 2: Optimised click-per-card fallback (go_back, reduced sleeps).
+    Tier 2: Per-window card harvest (anchors + image counts in one evaluate);
+            click-through only for cards without a job anchor.
 
     P1: coordinator.is_available() pre-filter.
     P3: blacklist filter.
@@ -928,27 +1470,42 @@ def collect_job_urls(
         coordinator = NullCoordinator()
     if blacklist is None:
         blacklist = set()
+    # Normalise once so no tier or loop needs an "or set()" fallback
+    coord_held = coord_held or frozenset()
+    coord_done = coord_done or frozenset()
 
     annotate_url = page.url
 
     # ── Tier 0: Firestore subscription intercept ─────────────────────────────
-    tier0 = _network_collect_urls(page, count, min_images, blacklist, annotate_url, config,
-                                   coord_held=coord_held, coord_done=coord_done)
-    if tier0 is not None:
-        return tier0    # may be [] if coordination filtered everything
+    ran_tier0 = not _tier_recently_missed(page, "Tier0")
+    if ran_tier0:
+        tier0 = _network_collect_urls(page, count, min_images, blacklist, annotate_url, config,
+                                       coord_held=coord_held, coord_done=coord_done)
+        if tier0 is not None:
+            return tier0    # may be [] if coordination filtered everything
+        _note_tier_miss(page, "Tier0")
 
     # ── Tier 1: bulk extraction ──────────────────────────────────────────────
-    bulk = _bulk_collect_urls(
-        page, count, min_images, coordinator, blacklist,
-        annotate_url, direction="top_down", config=config,
-        coord_held=coord_held, coord_done=coord_done,
-    )
-    if bulk is not None:
-        return bulk     # may be [] if coordination filtered everything
+    if not _tier_recently_missed(page, "Tier1"):
+        bulk = _bulk_collect_urls(
+            page, count, min_images, coordinator, blacklist,
+            annotate_url, direction="top_down", config=config,
+            coord_held=coord_held, coord_done=coord_done,
+        )
+        if bulk is not None:
+            return bulk     # may be [] if coordination filtered everything
+        _note_tier_miss(page, "Tier1")
+
+    # Tier 0, second look: the listener kept capturing while Tier 1 ran
+    if ran_tier0:
+        late = _network_collect_urls(page, count, min_images, blacklist, annotate_url, config,
+                                     coord_held=coord_held, coord_done=coord_done, reload=False)
+        if late is not None:
+            return late
 
     # ── Tier 2: click-per-card fallback ──────────────────────────────
     logger.info("  [TopDown] Using click-per-card fallback")
-    urls = []
+    urls: dict = {}  # insertion-ordered; O(1) duplicate check
     current_data_index = 0
     max_checks = 300
 
@@ -957,69 +1514,26 @@ def collect_job_urls(
     _close_stray_popups(page)
 
     # Initial reset — runs once before the scan loop
-    _init_col = page.locator(_ANNOTATING_COL)
-    _init_col.locator(_VIRTUOSO).first.evaluate("e => { e.scrollTop = 0; }")
-    time.sleep(0.5)
+    _evaluate_on_col(page, _JS_SCROLL_TO_EDGE, False)
+    _wait_scroll_settled(page)
+
+    harvested: dict = {}    # data-index -> (href | None, image count)
+    card_kwargs = dict(
+        harvested=harvested, skip_reasons=_skip_reasons(coord_done, coord_held, blacklist),
+        urls=urls, min_images=min_images, annotate_url=annotate_url, config=config,
+    )
 
     while len(urls) < count and current_data_index < max_checks:
         try:
-            # Re-acquire locators each iteration — they become stale after
-            # SPA navigation + _fast_navigate_back() replaces the DOM.
-            annotating_col = page.locator(_ANNOTATING_COL)
-            scroller = annotating_col.locator(_VIRTUOSO).first
-
-            # Use shared helper to scroll the target index into view
-            card_wrapper = _scroll_to_card(page, scroller, annotating_col, current_data_index)
-
-            if card_wrapper is None:
+            # One evaluate per Virtuoso window reads every rendered card's
+            # anchor and image count; only anchor-less cards are clicked.
+            verdict, job_url = _tier2_card_verdict(page, current_data_index, **card_kwargs)
+            if verdict == "unreachable":
                 logger.warning(f"  Could not find card at index {current_data_index}. End of list?")
                 break
-
-            # Check image count
-            card_inner = card_wrapper.locator(".AnnotationJobCard").first
-            try:
-                img_count_text = card_inner.locator("p.text-xs.font-semibold.text-gray-700").first.inner_text()
-                img_match = re.search(r"(\d+)\s+Images", img_count_text)
-                img_count = int(img_match.group(1)) if img_match else 0
-            except Exception:
-                img_count = 0
-
-            if img_count < min_images:
-                logger.info(f"  Skipping index {current_data_index}: {img_count} images (< {min_images})")
-                current_data_index += 1
-                continue
-
-            logger.info(f"  Processing index {current_data_index}: {img_count} images")
-
-            # Click card -> detect new tab or SPA nav -> extract URL
-            time.sleep(0.3)
-            job_url = _click_card_and_get_url(page, card_inner, annotate_url)
-
-            if job_url is None:
-                logger.warning(f"  Could not extract URL from index {current_data_index}. Skipping.")
-                current_data_index += 1
-                continue
-
-            # P3: differentiated skip checks
-            if job_url in (coord_done or set()):
-                logger.info(f"  Skipping already-done URL: {job_url[-30:]}")
-                current_data_index += 1
-                continue
-            if job_url in (coord_held or set()):
-                logger.info(f"  Skipping held-by-other URL: {job_url[-30:]}")
-                current_data_index += 1
-                continue
-            if job_url in blacklist:
-                logger.info(f"  Skipping blacklisted URL: {job_url[-30:]}")
-                current_data_index += 1
-                continue
-
-            if job_url not in urls:
-                urls.append(job_url)
-                logger.info(f"  > Collected URL: {job_url}")
-            else:
-                logger.warning(f"  Duplicate URL, skipping: {job_url[-30:]}")
-
+            if verdict == "collect":
+                urls[job_url] = None
+                logger.info("  > Collected URL (idx %s): %s", current_data_index, job_url)
             current_data_index += 1
 
         except Exception as e:
@@ -1031,8 +1545,8 @@ def collect_job_urls(
                 _fast_navigate_back(page, annotate_url)
             current_data_index += 1
 
-    logger.info(f"Collected {len(urls)} valid job URLs (checked {current_data_index} indices)")
-    return urls
+    logger.info("Collected %s valid job URLs (checked %s indices)", len(urls), current_data_index)
+    return list(urls)
 
 
 def collect_job_urls_bottom_up(
@@ -1050,7 +1564,8 @@ def collect_job_urls_bottom_up(
     Collect job URLs bottom-up.
 
     Tier 1: React fiber bulk extraction (no clicking, ~seconds).
-    Tier 2: Optimised click-per-card fallback (go_back, reduced sleeps).
+    Tier 2: Per-window card harvest (anchors + image counts in one evaluate);
+            click-through only for cards without a job anchor.
 
     P1: coordinator.is_available() pre-filter.
     P3: blacklist filter.
@@ -1061,27 +1576,42 @@ def collect_job_urls_bottom_up(
         coordinator = NullCoordinator()
     if blacklist is None:
         blacklist = set()
+    # Normalise once so no tier or loop needs an "or set()" fallback
+    coord_held = coord_held or frozenset()
+    coord_done = coord_done or frozenset()
 
     annotate_url = page.url
 
     # ── Tier 0: Firestore subscription intercept ─────────────────────────────
-    tier0 = _network_collect_urls(page, count, min_images, blacklist, annotate_url, config,
-                                   coord_held=coord_held, coord_done=coord_done)
-    if tier0 is not None:
-        return tier0    # may be [] if coordination filtered everything
+    ran_tier0 = not _tier_recently_missed(page, "Tier0")
+    if ran_tier0:
+        tier0 = _network_collect_urls(page, count, min_images, blacklist, annotate_url, config,
+                                       coord_held=coord_held, coord_done=coord_done)
+        if tier0 is not None:
+            return tier0    # may be [] if coordination filtered everything
+        _note_tier_miss(page, "Tier0")
 
     # ── Tier 1: bulk extraction ──────────────────────────────────────────────
-    bulk = _bulk_collect_urls(
-        page, count, min_images, coordinator, blacklist,
-        annotate_url, direction="bottom_up", config=config,
-        coord_held=coord_held, coord_done=coord_done,
-    )
-    if bulk is not None:
-        return bulk     # may be [] if coordination filtered everything
+    if not _tier_recently_missed(page, "Tier1"):
+        bulk = _bulk_collect_urls(
+            page, count, min_images, coordinator, blacklist,
+            annotate_url, direction="bottom_up", config=config,
+            coord_held=coord_held, coord_done=coord_done,
+        )
+        if bulk is not None:
+            return bulk     # may be [] if coordination filtered everything
+        _note_tier_miss(page, "Tier1")
+
+    # Tier 0, second look: the listener kept capturing while Tier 1 ran
+    if ran_tier0:
+        late = _network_collect_urls(page, count, min_images, blacklist, annotate_url, config,
+                                     coord_held=coord_held, coord_done=coord_done, reload=False)
+        if late is not None:
+            return late
 
     # ── Tier 2: click-per-card fallback ──────────────────────────────
     logger.info("  [BottomUp] Using click-per-card fallback")
-    urls = []
+    urls: dict = {}  # insertion-ordered; O(1) duplicate check
     consecutive_skips = 0
     MAX_CONSECUTIVE_SKIPS = 15
 
@@ -1089,15 +1619,10 @@ def collect_job_urls_bottom_up(
     _dismiss_detail_overlay(page)
     _close_stray_popups(page)
 
-    # Initial locators — captured by _scroll_to_bottom_and_get_max_index() closure.
-    # Re-assigned inside the while loop to stay fresh after SPA nav + back.
-    annotating_col = page.locator(_ANNOTATING_COL)
-    scroller = annotating_col.locator(_VIRTUOSO).first
-
     def _scroll_to_bottom_and_get_max_index():
         try:
-            scroller.evaluate("e => { e.scrollTop = e.scrollHeight; }")
-            time.sleep(0.5)
+            _evaluate_on_col(page, _JS_SCROLL_TO_EDGE, True)
+            _wait_scroll_settled(page)
             # Wait briefly for virtuoso to render bottom cards
             try:
                 page.wait_for_selector(
@@ -1106,37 +1631,29 @@ def collect_job_urls_bottom_up(
                 )
             except Exception:
                 pass
-            max_idx = page.evaluate("""
-                () => {
-                    const cols = document.querySelectorAll('.boardColumn');
-                    let col = null;
-                    cols.forEach(c => {
-                        const h2 = c.querySelector('h2');
-                        if (h2 && h2.textContent.trim() === 'Annotating') col = c;
-                    });
-                    if (!col) return -1;
-                    const items = col.querySelectorAll('div[data-index]');
-                    let max = -1;
-                    items.forEach(el => {
-                        const idx = parseInt(el.getAttribute('data-index'), 10);
-                        if (!isNaN(idx) && idx > max) max = idx;
-                    });
-                    return max;
-                }
-            """)
+            max_idx = _evaluate_on_col(page, _JS_MAX_RENDERED_INDEX)
             return max_idx if max_idx >= 0 else 0
         except Exception as e:
-            logger.debug(f"  _scroll_to_bottom_and_get_max_index error: {e}")
+            logger.debug("  _scroll_to_bottom_and_get_max_index error: %s", e)
             return 0
 
     current_data_index = _scroll_to_bottom_and_get_max_index()
-    logger.info(f"Bottom-up collection starting at data-index={current_data_index}")
+    logger.info("Bottom-up collection starting at data-index=%s", current_data_index)
 
     if current_data_index <= 0:
         logger.warning("Could not find any bottom cards. Returning empty collection.")
-        return urls
+        return []
 
-    checked_indices = set()
+    # The index only descends, except when a board refresh jumps to a new max;
+    # each earlier descent is kept as one (lo, hi) run instead of a set.
+    scanned_runs: list = []
+    run_top = current_data_index
+    harvested: dict = {}    # data-index -> (href | None, image count)
+    card_kwargs = dict(
+        harvested=harvested, skip_reasons=_skip_reasons(coord_done, coord_held, blacklist),
+        urls=urls, min_images=min_images, annotate_url=annotate_url, config=config,
+        tag="[BU] ",
+    )
 
     while len(urls) < count:
         if current_data_index < 0:
@@ -1150,83 +1667,36 @@ def collect_job_urls_bottom_up(
             )
             break
 
-        if current_data_index in checked_indices:
-            current_data_index -= 1
+        run = next((r for r in scanned_runs if r[0] <= current_data_index <= r[1]), None)
+        if run is not None:
+            current_data_index = run[0] - 1  # skip the whole already-scanned run
             continue
 
-        checked_indices.add(current_data_index)
-
         try:
-            # Re-acquire locators each iteration — stale after SPA nav + back.
-            # The closure in _scroll_to_bottom_and_get_max_index() sees the
-            # updated values because Python closures capture by reference.
-            annotating_col = page.locator(_ANNOTATING_COL)
-            scroller = annotating_col.locator(_VIRTUOSO).first
+            # One evaluate per Virtuoso window reads every rendered card's
+            # anchor and image count; only anchor-less cards are clicked.
+            verdict, job_url = _tier2_card_verdict(page, current_data_index, **card_kwargs)
 
-            # Use shared helper to scroll the target index into view
-            card_wrapper = _scroll_to_card(page, scroller, annotating_col, current_data_index)
-
-            if card_wrapper is None:
+            if verdict == "unreachable":
                 # Fallback: re-check max index in case board refreshed
                 new_max = _scroll_to_bottom_and_get_max_index()
-                if new_max != current_data_index and new_max not in checked_indices:
-                    logger.info(f"  Board refreshed: max index changed {current_data_index} -> {new_max}")
-                    current_data_index = new_max
+                if not (current_data_index <= new_max <= run_top) and not any(
+                    lo <= new_max <= hi for lo, hi in scanned_runs
+                ):
+                    logger.info("  Board refreshed: max index changed %s -> %s", current_data_index, new_max)
+                    scanned_runs.append((current_data_index, run_top))
+                    current_data_index = run_top = new_max
+                    harvested.clear()
                 else:
                     logger.warning(f"  Card at index {current_data_index} unreachable. Skipping.")
                     current_data_index -= 1
                 continue
-
-            # Check image count
-            card_inner = card_wrapper.locator(".AnnotationJobCard").first
-            try:
-                img_count_text = card_inner.locator("p.text-xs.font-semibold.text-gray-700").first.inner_text()
-                img_match = re.search(r"(\d+)\s+Images", img_count_text)
-                img_count = int(img_match.group(1)) if img_match else 0
-            except Exception:
-                img_count = 0
-
-            if img_count < min_images:
-                logger.info(f"  [BU] Skipping index {current_data_index}: {img_count} images (< {min_images})")
-                current_data_index -= 1
-                continue
-
-            # Click card -> detect new tab or SPA nav -> extract URL
-            time.sleep(0.3)
-            job_url = _click_card_and_get_url(page, card_inner, annotate_url)
-
-            if job_url is None:
-                logger.warning(f"  [BU] Could not extract URL from index {current_data_index}. Skipping.")
-                current_data_index -= 1
-                continue
-
-            # P3: differentiated skip checks
-            if coord_done and job_url in coord_done:
-                logger.info(f"  [BU] Skipping already-done URL: {job_url[-30:]}")
-                consecutive_skips += 1
-                current_data_index -= 1
-                continue
-            if coord_held and job_url in coord_held:
-                logger.info(f"  [BU] Skipping held-by-other URL: {job_url[-30:]}")
+            if verdict == "skip":
                 consecutive_skips += 1
-                current_data_index -= 1
-                continue
-            if job_url in blacklist:
-                logger.info(f"  [BU] Skipping blacklisted URL: {job_url[-30:]}")
-                consecutive_skips += 1
-                current_data_index -= 1
-                continue
-
-            if job_url in urls:
-                logger.warning(f"  [BU] Duplicate URL, skipping: {job_url[-30:]}")
-                consecutive_skips += 1
-                current_data_index -= 1
-                continue
-
-            consecutive_skips = 0
-            urls.append(job_url)
-            logger.info(f"  [BU] Collected URL (idx {current_data_index}): {job_url}")
-
+            elif verdict == "collect":
+                consecutive_skips = 0
+                urls[job_url] = None
+                logger.info("  [BU] Collected URL (idx %s): %s", current_data_index, job_url)
             current_data_index -= 1
 
         except Exception as e:
@@ -1238,8 +1708,8 @@ def collect_job_urls_bottom_up(
                 _fast_navigate_back(page, annotate_url)
             current_data_index -= 1
 
-    logger.info(f"[Bottom-up] Collected {len(urls)} job URLs")
-    return urls
+    logger.info("[Bottom-up] Collected %s job URLs", len(urls))
+    return list(urls)
 
 
 def _wait_for_board_scroller(page: Page) -> None:
@@ -1257,6 +1727,75 @@ def _wait_for_board_scroller(page: Page) -> None:
         pass
 
 
+# Gates 1, 2, 3 and 5 of wait_for_card_detail as one predicate: detail view,
+# progress legend and image list visible, plus an image-grid item (attached
+# when the arg is true — headless — else visible).
+_JS_DETAIL_READY = """
+(gridAttached) => {
+    const vis = el => !!el && el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== 'hidden';
+    const d = document.querySelector('.AnnotationJobDetailView');
+    if (!vis(d)) return false;
+    if (!vis(d.querySelector('.AnnotationJobProgressLegend'))) return false;
+    if (!vis(d.querySelector('.AnnotationJobImageList'))) return false;
+    const grid = d.querySelectorAll(
+        '#annotationContainer .ImageCard, .AnnotationJobImageList .ImageItem');
+    return gridAttached ? grid.length > 0 : Array.prototype.some.call(grid, vis);
+}
+"""
+
+
+# Classify the detail view's action button in one pass.  Arg: headless
+# (attached + enabled suffices; else it must also be visible).  Returns
+# [action, button label] for the first match in priority order, or null.
+# Labels match like :has-text(): case-insensitive, whitespace collapsed.
+_JS_CLASSIFY_DETAIL_ACTION = """
+(headless) => {
+    const d = document.querySelector('.AnnotationJobDetailView');
+    if (!d) return null;
+    const usable = b => !b.disabled && (headless || b.getClientRects().length > 0);
+    const buttons = Array.from(d.querySelectorAll('button.btn2.medium')).filter(usable)
+        .map(b => [b, b.textContent.replace(/\\s+/g, ' ').toLowerCase()]);
+    const find = (txt, primary) => (buttons.find(
+        ([b, t]) => t.includes(txt) && (!primary || b.classList.contains('primary'))) || [])[0];
+    for (const [action, txt, primary] of [
+        ['start_annotating', 'start annotating', false],
+        ['start_annotating', 'continue annotating', false],
+        ['add_to_dataset', 'to dataset', true],
+        ['submit_for_review', 'submit for review', false],
+    ]) {
+        const b = find(txt, primary);
+        if (b) return [action, b.textContent.trim()];
+    }
+    return null;
+}
+"""
+
+
+# Every tick_detail_wait gate in one pass.  Arg: headless (image grid only
+# needs to be attached, buttons only enabled).  Returns null until the detail
+# view exists, else {legend, imgList, grid, header, action} where action is
+# _JS_CLASSIFY_DETAIL_ACTION's [action, label] or null.
+_JS_PROBE_DETAIL_GATES = """
+(headless) => {
+    const vis = el => !!el && el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== 'hidden';
+    const d = document.querySelector('.AnnotationJobDetailView');
+    if (!d) return null;
+    const grid = d.querySelectorAll(
+        '#annotationContainer .ImageCard, .AnnotationJobImageList .ImageItem');
+    const header = d.querySelector('h1, .text-xl');
+    return {
+        legend: vis(d.querySelector('.AnnotationJobProgressLegend')),
+        imgList: vis(d.querySelector('.AnnotationJobImageList')),
+        grid: headless ? grid.length > 0 : Array.prototype.some.call(grid, vis),
+        header: header ? header.innerText : '',
+        action: (""" + _JS_CLASSIFY_DETAIL_ACTION.strip() + """)(headless),
+    };
+}
+"""
+
+
 def wait_for_card_detail(page: Page, *, headless: bool = False):
     """
     Wait for the card detail view to fully load.
@@ -1265,6 +1804,10 @@ def wait_for_card_detail(page: Page, *, headless: bool = False):
 
     P2: single reload recovery on each gate failure.
     P6: headless uses state="attached" for image grid gate.
+
+    The selector gates are first awaited together (_JS_DETAIL_READY, one
+    wait_for_function).  Only when that times out do the per-gate waits run,
+    briefly, to find the missing gate and recover it.
     """
     detail_view = ".AnnotationJobDetailView"
 
@@ -1282,36 +1825,48 @@ def wait_for_card_detail(page: Page, *, headless: bool = False):
     try:
         page.wait_for_load_state("domcontentloaded", timeout=CARD_LOAD_TIMEOUT)
 
-        # Gate 1: detail view wrapper
+        # Gates 1-3 + 5 in one in-page wait
         try:
-            page.wait_for_selector(detail_view, state="visible", timeout=CARD_LOAD_TIMEOUT)
+            page.wait_for_function(_JS_DETAIL_READY, arg=headless, timeout=CARD_LOAD_TIMEOUT)
+            ready = True
         except Exception:
-            if not _try_reload_recovery("detail view wrapper not visible"):
-                return None
+            ready = False
+        gate_timeout = 1_000  # full budget already spent — only locate the gap
 
-        # Gate 2: progress legend
-        progress_selector = f"{detail_view} .AnnotationJobProgressLegend"
-        try:
-            page.wait_for_selector(progress_selector, state="visible", timeout=CARD_LOAD_TIMEOUT)
-        except Exception:
-            if not _try_reload_recovery("progress legend not visible"):
-                return None
+        if not ready:
+            # Gate 1: detail view wrapper
             try:
-                page.wait_for_selector(progress_selector, state="visible", timeout=CARD_LOAD_TIMEOUT)
+                page.wait_for_selector(detail_view, state="visible", timeout=gate_timeout)
             except Exception:
-                return None
+                if not _try_reload_recovery("detail view wrapper not visible"):
+                    return None
+                gate_timeout = CARD_LOAD_TIMEOUT  # reloaded — full budget again
 
-        # Gate 3: image list tab bar
-        image_list_sel = f"{detail_view} .AnnotationJobImageList"
-        try:
-            page.wait_for_selector(image_list_sel, state="visible", timeout=CARD_LOAD_TIMEOUT)
-        except Exception:
-            if not _try_reload_recovery("image list tab bar not visible"):
-                return None
+            # Gate 2: progress legend
+            progress_selector = f"{detail_view} .AnnotationJobProgressLegend"
             try:
-                page.wait_for_selector(image_list_sel, state="visible", timeout=CARD_LOAD_TIMEOUT)
+                page.wait_for_selector(progress_selector, state="visible", timeout=gate_timeout)
             except Exception:
-                return None
+                if not _try_reload_recovery("progress legend not visible"):
+                    return None
+                gate_timeout = CARD_LOAD_TIMEOUT  # reloaded — full budget again
+                try:
+                    page.wait_for_selector(progress_selector, state="visible", timeout=CARD_LOAD_TIMEOUT)
+                except Exception:
+                    return None
+
+            # Gate 3: image list tab bar
+            image_list_sel = f"{detail_view} .AnnotationJobImageList"
+            try:
+                page.wait_for_selector(image_list_sel, state="visible", timeout=gate_timeout)
+            except Exception:
+                if not _try_reload_recovery("image list tab bar not visible"):
+                    return None
+                gate_timeout = CARD_LOAD_TIMEOUT  # reloaded — full budget again
+                try:
+                    page.wait_for_selector(image_list_sel, state="visible", timeout=CARD_LOAD_TIMEOUT)
+                except Exception:
+                    return None
 
         # Gate 4: network idle (best-effort)
         try:
@@ -1319,52 +1874,30 @@ def wait_for_card_detail(page: Page, *, headless: bool = False):
         except Exception:
             pass
 
-        # Gate 5: image grid
-        image_grid_sel = (
-            f"{detail_view} #annotationContainer .ImageCard, "
-            f"{detail_view} .AnnotationJobImageList .ImageItem"
-        )
-        gate_state = "attached" if headless else "visible"
-        try:
-            page.wait_for_selector(image_grid_sel, state=gate_state, timeout=CARD_LOAD_TIMEOUT)
-        except Exception:
-            if not _try_reload_recovery(f"image grid not {gate_state}"):
-                return None
+        if not ready:
+            # Gate 5: image grid
+            image_grid_sel = (
+                f"{detail_view} #annotationContainer .ImageCard, "
+                f"{detail_view} .AnnotationJobImageList .ImageItem"
+            )
+            gate_state = "attached" if headless else "visible"
             try:
-                page.wait_for_selector(image_grid_sel, state=gate_state, timeout=CARD_LOAD_TIMEOUT)
+                page.wait_for_selector(image_grid_sel, state=gate_state, timeout=gate_timeout)
             except Exception:
-                return None
-
-        # P6: headless-safe button check
-        def _find_button(selector: str) -> bool:
-            loc = page.locator(selector).first
-            if loc.count() == 0:
-                return False
-            if loc.is_visible() and loc.is_enabled():
-                return True
-            if headless:
+                if not _try_reload_recovery(f"image grid not {gate_state}"):
+                    return None
+                gate_timeout = CARD_LOAD_TIMEOUT  # reloaded — full budget again
                 try:
-                    loc.wait_for(state="attached", timeout=3_000)
-                    return loc.is_enabled()
+                    page.wait_for_selector(image_grid_sel, state=gate_state, timeout=CARD_LOAD_TIMEOUT)
                 except Exception:
-                    pass
-            return False
+                    return None
 
-        for btn_text in ("Start Annotating", "Continue Annotating"):
-            sel = f"{detail_view} button.btn2.medium:has-text('{btn_text}')"
-            if _find_button(sel):
-                logger.info(f"  Card detail loaded -- '{btn_text}' -> start_annotating")
-                return "start_annotating"
-
-        add_sel = f"{detail_view} button.btn2.medium.primary:has-text('to Dataset'):not([disabled])"
-        if _find_button(add_sel):
-            logger.info("  Card detail loaded -- 'Add to Dataset' -> add_to_dataset")
-            return "add_to_dataset"
-
-        review_sel = f"{detail_view} button.btn2.medium:has-text('Submit for Review')"
-        if _find_button(review_sel):
-            logger.info("  Card detail loaded -- 'Submit for Review' -> submit_for_review")
-            return "submit_for_review"
+        # P6: headless-safe button check — all candidates in one evaluate
+        found = page.evaluate(_JS_CLASSIFY_DETAIL_ACTION, headless)
+        if found:
+            action, btn_text = found
+            logger.info("  Card detail loaded -- '%s' -> %s", btn_text, action)
+            return action
 
         logger.warning("  Card detail loaded but action button unclassified.")
         capture_diagnostics(page, "card_action_unclassified")
@@ -1379,43 +1912,62 @@ def wait_for_card_detail(page: Page, *, headless: bool = False):
 def wait_for_tab_content(page: Page, timeout: int = 15_000) -> None:
     """Wait for the image tab content to render after switching tabs."""
     try:
-        page.wait_for_selector(
-            f"{DETAIL_VIEW} #annotationContainer",
-            state="attached", timeout=timeout,
-        )
-        page.wait_for_selector(
-            f"{DETAIL_VIEW} .ImageCard, "
-            f"{DETAIL_VIEW} .ImageItem, "
-            f"{DETAIL_VIEW} .ImagesCollectionGrid, "
-            f"{DETAIL_VIEW} #annotationContainer .ImageCollection",
-            state="visible", timeout=timeout,
-        )
+        page.wait_for_selector(_IMAGE_CONTAINER_SEL, state="attached", timeout=timeout)
+        page.wait_for_selector(_TAB_CONTENT_SEL, state="visible", timeout=timeout)
     except Exception:
         pass
 
 
+# Both get_unannotated_count strategies in one pass: the visible number in the
+# Unannotated tab badge, else in the progress legend.  Returns int or null.
+_JS_UNANNOTATED_COUNT = """
+() => {
+    const d = document.querySelector('.AnnotationJobDetailView');
+    if (!d) return null;
+    const vis = el => !!el && el.getClientRects().length > 0;
+    const num = el => {
+        const m = vis(el) && /(\\d+)/.exec(el.innerText || '');
+        return m ? parseInt(m[1], 10) : null;
+    };
+    for (const btn of d.querySelectorAll('.AnnotationJobImageList button')) {
+        if (!btn.textContent.toLowerCase().includes('unannotated')) continue;  // :has-text() is case-insensitive
+        const badge = btn.querySelector('span.font-mono')
+            || Array.from(btn.querySelectorAll('span')).find(s => /^\\d+$/.test(s.textContent.trim()));
+        const n = num(badge);
+        if (n !== null) return n;
+        break;
+    }
+    for (const legend of d.querySelectorAll('.AnnotationJobProgressLegend')) {
+        if (!legend.querySelector('.Unannotated')) continue;
+        const n = num(legend.querySelector('.font-mono'));
+        if (n !== null) return n;
+    }
+    return null;
+}
+"""
+
+
 def get_unannotated_count(page: Page) -> int:
-    """Parse unannotated count from tab badge or progress legend."""
+    """Parse unannotated count from tab badge or progress legend.
+
+    Strategies 1 and 2 are read together in one evaluate; only when neither
+    has a number yet does the legend wait (up to 10 s) run.
+    """
     detail = ".AnnotationJobDetailView"
 
-    # Strategy 1: tab badge
     try:
-        tab_btn = page.locator(f"{detail} .AnnotationJobImageList button:has-text('Unannotated')").first
-        badge = tab_btn.locator("span.font-mono, span:text-matches('^\\d+$')").first
-        if badge.count() > 0 and badge.is_visible():
-            badge_text = badge.inner_text().strip()
-            match = re.search(r"(\d+)", badge_text)
-            if match:
-                return int(match.group(1))
+        n = page.evaluate(_JS_UNANNOTATED_COUNT)
+        if n is not None:
+            return n
     except Exception:
         pass
 
-    # Strategy 2: progress legend
+    # Strategy 2: progress legend — wait for it to render
     try:
         legend = page.locator(f"{detail} .AnnotationJobProgressLegend:has(.Unannotated) .font-mono").first
         legend.wait_for(state="visible", timeout=10_000)
         text = legend.inner_text().strip()
-        match = re.search(r"(\d+)", text)
+        match = _RE_DIGIT.search(text)
         if match:
             return int(match.group(1))
     except Exception as e:
@@ -1434,31 +1986,27 @@ def start_null_conversion(page: Page, *, config: dict = None) -> bool:
         _dismiss_overlays(page)
 
         # Step 1: click Unannotated tab
-        unannotated_tab = page.locator(
-            f"{DETAIL_VIEW} .AnnotationJobImageList button:has-text('Unannotated')"
-        ).first
+        unannotated_tab = _loc(page, _UNANNOTATED_TAB_SEL)
         unannotated_tab.wait_for(state="visible", timeout=CARD_LOAD_TIMEOUT)
         unannotated_tab.click()
         wait_for_tab_content(page)
 
-        _dismiss_overlays(page)
+        _dismiss_overlays(page, force=True)
 
         # Step 2: click Null button
-        null_btn = page.locator(f"{DETAIL_VIEW} button:has(i.far.fa-empty-set)").first
+        null_btn = _loc(page, _NULL_BTN_SEL)
         try:
             null_btn.wait_for(state="visible", timeout=5_000)
         except Exception:
             # P2 L2: switch tabs and retry
             logger.warning("  Null button not found -- switching tabs and retrying")
-            annotated_tab = page.locator(
-                f"{DETAIL_VIEW} .AnnotationJobImageList button:has-text('Annotated')"
-            ).first
+            annotated_tab = _loc(page, _ANNOTATED_TAB_SEL)
             if annotated_tab.is_visible():
                 annotated_tab.click()
                 time.sleep(1)
                 unannotated_tab.click()
                 wait_for_tab_content(page)
-                _dismiss_overlays(page)
+                _dismiss_overlays(page, force=True)
             try:
                 null_btn.wait_for(state="visible", timeout=5_000)
             except Exception:
@@ -1474,13 +2022,13 @@ def start_null_conversion(page: Page, *, config: dict = None) -> bool:
         # Step 3: SweetAlert confirmation
         _swal_timeout = int(15_000 * _tmul)
         try:
-            page.wait_for_selector(".swal2-popup", state="visible", timeout=_swal_timeout)
+            page.wait_for_selector(_SWAL_POPUP_SEL, state="visible", timeout=_swal_timeout)
         except Exception:
             logger.warning("  SweetAlert did not appear -- retrying null click")
-            _dismiss_overlays(page)
+            _dismiss_overlays(page, force=True)
             null_btn.click()
             try:
-                page.wait_for_selector(".swal2-popup", state="visible", timeout=_swal_timeout)
+                page.wait_for_selector(_SWAL_POPUP_SEL, state="visible", timeout=_swal_timeout)
             except Exception:
                 capture_diagnostics(page, "null_conversion_swal_failed")
                 return False
@@ -1491,13 +2039,13 @@ def start_null_conversion(page: Page, *, config: dict = None) -> bool:
         # Only dismiss React fullscreen overlay -- do NOT dismiss SweetAlert here
         try:
             overlay = page.locator('div.fixed.bottom-0.left-0.right-0.top-0[class*="z-"]')
-            if overlay.count() > 0 and overlay.first.is_visible():
+            if overlay.first.is_visible():
                 overlay.first.wait_for(state="hidden", timeout=5_000)
         except Exception:
             pass
 
         _confirm_timeout = int(10_000 * _tmul)
-        mark_null_btn = page.locator("button.swal2-confirm")
+        mark_null_btn = _loc(page, _SWAL_CONFIRM_SEL)
         mark_null_btn.wait_for(state="visible", timeout=_confirm_timeout)
         mark_null_btn.click()
         logger.info("  Confirmed 'Mark null' -- processing started")
@@ -1517,21 +2065,32 @@ def start_null_conversion(page: Page, *, config: dict = None) -> bool:
         return False
 
 
+# SweetAlert progress snapshot: {text, popup}.  text is the "N of M" line
+# (null when absent); popup is whether a .swal2-popup is visible.
+_JS_PROCESSING_PROGRESS = """
+() => {
+    const el = document.querySelector('#swal2-content .text-sm.text-gray-500');
+    if (el) return {text: (el.innerText || '').trim(), popup: true};
+    const popup = document.querySelector('.swal2-popup');
+    return {text: null, popup: !!popup && popup.getClientRects().length > 0};
+}
+"""
+
+
 def is_processing_complete(page: Page) -> tuple:
     """
-    Check if null-conversion processing is complete.
+    Check if null-conversion processing is complete (one evaluate).
     Returns (is_done, progress_text, current_count, total_count).
     """
     try:
-        swal_content = page.locator("#swal2-content .text-sm.text-gray-500").first
-        if swal_content.count() == 0:
-            swal = page.locator(".swal2-popup")
-            if swal.count() == 0 or not swal.is_visible():
+        snap = _call_page_helper(page, "processingProgress", _JS_PROCESSING_PROGRESS)
+        if snap["text"] is None:
+            if not snap["popup"]:
                 return True, "No dialog visible", 0, 0
             return False, "Dialog visible but no progress text", 0, 0
 
-        progress_text = swal_content.inner_text().strip()
-        match = re.search(r"(\d+)\s+of\s+(\d+)", progress_text)
+        progress_text = snap["text"]
+        match = _RE_PROGRESS.search(progress_text)
         if match:
             current = int(match.group(1))
             total = int(match.group(2))
@@ -1561,11 +2120,11 @@ def dismiss_swal_if_present(page: Page) -> None:
             page.wait_for_timeout(500)
             return
 
-        okay_btn = page.locator("button.swal2-confirm")
-        if okay_btn.count() > 0 and okay_btn.first.is_visible():
-            okay_btn.first.click(force=True)
+        okay_btn = _loc(page, _SWAL_CONFIRM_SEL)
+        if okay_btn.is_visible():
+            okay_btn.click(force=True)
             try:
-                page.wait_for_selector(".swal2-popup", state="hidden", timeout=5_000)
+                page.wait_for_selector(_SWAL_POPUP_SEL, state="hidden", timeout=5_000)
             except Exception:
                 pass
             return
@@ -1575,31 +2134,209 @@ def dismiss_swal_if_present(page: Page) -> None:
         pass
 
 
-def _dismiss_overlays(page: Page) -> None:
+# Close and remove every SweetAlert (Swal.close(), else a DOM click on its
+# confirm button so app handlers still run), then report whether a visible
+# React fullscreen overlay remains.  A no-op returning false on a clean page.
+_JS_DISMISS_OVERLAYS = """
+() => {
+    try {
+        if (typeof Swal !== 'undefined' && Swal.isVisible && Swal.isVisible()) {
+            Swal.close();
+        } else {
+            const ok = document.querySelector('.swal2-container button.swal2-confirm');
+            if (ok && ok.getClientRects().length) ok.click();
+        }
+    } catch (e) {}
+    document.querySelectorAll('.swal2-container').forEach(el => el.remove());
+    for (const el of document.querySelectorAll('div.fixed.bottom-0.left-0.right-0.top-0[class*="z-"]')) {
+        if (el.getClientRects().length) return true;
+    }
+    return false;
+}
+"""
+
+
+# Monotonic time each page was last found overlay-free, so back-to-back
+# dismissals (retry paths call it at every step) skip the DOM scan.  Reset to
+# 0 on every main-frame navigation, since a reload can bring a new overlay.
+# SPA clicks open overlays without navigating, so a dismiss that follows a
+# click passes force=True.
+_OVERLAYS_CLEAR_AT: "weakref.WeakKeyDictionary[Page, float]" = weakref.WeakKeyDictionary()
+_OVERLAYS_CLEAR_TTL_S = 0.5
+
+
+def _note_overlays_clear(page: Page) -> None:
+    if page not in _OVERLAYS_CLEAR_AT:
+        page_ref = weakref.ref(page)
+
+        def _on_navigated(frame) -> None:
+            p = page_ref()
+            if p is not None and frame.parent_frame is None:
+                _OVERLAYS_CLEAR_AT[p] = 0.0
+
+        page.on("framenavigated", _on_navigated)
+    _OVERLAYS_CLEAR_AT[page] = time.monotonic()
+
+
+def _dismiss_overlays(page: Page, *, force: bool = False) -> None:
     """
     Dismiss SweetAlert and React fullscreen overlays.
 
     P6: JS-based removal for headless mode.
+    SweetAlert close + removal and the overlay check are one evaluate
+    (_JS_DISMISS_OVERLAYS); a clean page costs that single round-trip, and
+    a repeat call within _OVERLAYS_CLEAR_TTL_S of a clean pass costs none
+    unless ``force`` is set (callers pass it right after a click).
+    The Playwright wait only runs while a React overlay is still showing.
     """
-    dismiss_swal_if_present(page)
+    if not force and time.monotonic() - _OVERLAYS_CLEAR_AT.get(page, 0.0) < _OVERLAYS_CLEAR_TTL_S:
+        return
     try:
-        page.evaluate("() => document.querySelectorAll('.swal2-container').forEach(el => el.remove())")
+        overlay_visible = _call_page_helper(page, "dismissOverlays", _JS_DISMISS_OVERLAYS)
     except Exception:
-        pass
+        dismiss_swal_if_present(page)  # evaluate failed — strategy-by-strategy
+        overlay_visible = True
+    if not overlay_visible:
+        _note_overlays_clear(page)
+        return
     try:
-        overlay = page.locator('div.fixed.bottom-0.left-0.right-0.top-0[class*="z-"]')
-        if overlay.count() > 0 and overlay.first.is_visible():
-            overlay.first.wait_for(state="hidden", timeout=10_000)
+        overlay = page.locator('div.fixed.bottom-0.left-0.right-0.top-0[class*="z-"]').first
+        if overlay.is_visible():
+            overlay.wait_for(state="hidden", timeout=10_000)
     except Exception:
         pass
 
 
+# Per-page cache of ``page.locator(sel).first`` for the fixed selectors above.
+# Locators are lazy and survive navigation, so one per page is enough.
+_LOCATORS: "weakref.WeakKeyDictionary[Page, dict]" = weakref.WeakKeyDictionary()
+
+
+def _loc(page: Page, selector: str):
+    """Cached first-match Locator for ``selector`` on ``page``."""
+    cache = _LOCATORS.get(page)
+    if cache is None:
+        cache = _LOCATORS[page] = {}
+    loc = cache.get(selector)
+    if loc is None:
+        loc = cache[selector] = page.locator(selector).first
+    return loc
+
+
+# Happy-path add-to-dataset run entirely in the page: click the Annotated tab,
+# wait for the enabled Add button, click it, wait for the confirm modal, click
+# that and wait for the dialog to close.  Waits are MutationObserver-driven
+# with a slow interval as backstop (rAF is paused in background tabs).
+# Returns {ok, stage, add, modal}; ``stage`` names the step that timed out.
+# With ``fromModal`` the Add click is assumed done and only the confirm/close
+# tail runs (the locator fallback uses this after its own Add click).
+_JS_ADD_TO_DATASET = """
+async ([detail, modalId, modalSel, dialogSel, addTimeoutMs, modalTimeoutMs, fromModal]) => {
+    const visible = el => !!el && el.isConnected && el.getClientRects().length > 0;
+    const text = el => (el.textContent || '').trim();
+    const waitFor = (find, timeoutMs) => new Promise(resolve => {
+        const hit = find();
+        if (hit) return resolve(hit);
+        let done = false;
+        const finish = v => {
+            if (done) return;
+            done = true; obs.disconnect(); clearInterval(poll); clearTimeout(timer);
+            resolve(v);
+        };
+        const check = () => { const el = find(); if (el) finish(el); };
+        const obs = new MutationObserver(check);
+        obs.observe(document.body, {childList: true, subtree: true, attributes: true,
+                                    attributeFilter: ['disabled', 'class', 'style']});
+        const poll = setInterval(check, 250);
+        const timer = setTimeout(() => finish(null), timeoutMs);
+    });
+    const out = {ok: false, stage: 'add', add: null, modal: null};
+
+    if (fromModal) {
+        out.stage = 'modal';
+    } else {
+        const tab = [...document.querySelectorAll(detail + ' .AnnotationJobImageList button')]
+            .find(b => text(b).toLowerCase().includes('annotated'));
+        if (visible(tab)) tab.click();
+
+        const add = await waitFor(() =>
+            [...document.querySelectorAll(detail + ' button.btn2.medium.primary')]
+                .find(b => !b.disabled && visible(b) && text(b).toLowerCase().includes('to dataset')),
+            addTimeoutMs);
+        if (!add) return out;
+        out.add = text(add); out.stage = 'modal';
+        add.click();
+    }
+
+    // The confirm button's id is a direct getElementById; the class selector
+    // only runs while that id isn't rendered.
+    const findModal = () => {
+        const byId = document.getElementById(modalId);
+        return visible(byId) ? byId : [...document.querySelectorAll(modalSel)].find(visible);
+    };
+    const modal = await waitFor(findModal, modalTimeoutMs);
+    if (!modal) return out;
+    out.modal = text(modal); out.stage = 'close';
+    modal.click();
+
+    await waitFor(() => [...document.querySelectorAll(dialogSel)].some(visible) ? null : true,
+                  modalTimeoutMs);
+    out.ok = true;
+    return out;
+}
+"""
+
+
+# Installs window.__rfAddToDataset (the script above) once per document via
+# add_init_script, so later calls ship only a short stub over CDP.  The stub
+# reports 'not-installed' for documents loaded before registration.
+_JS_ADD_TO_DATASET_HELPER = """
+(() => {
+    if (window.__rfAddToDataset) return;
+    window.__rfAddToDataset = """ + _JS_ADD_TO_DATASET + """;
+})()
+"""
+_JS_CALL_ADD_TO_DATASET = """
+(args) => window.__rfAddToDataset ? window.__rfAddToDataset(args) : 'not-installed'
+"""
+
+_ADD_HELPER_PAGES: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+
+def _run_add_to_dataset_script(page: Page, args: list):
+    """Run _JS_ADD_TO_DATASET with ``args``, via the preinstalled helper when present."""
+    result = page.evaluate(_JS_CALL_ADD_TO_DATASET, args)
+    if result != "not-installed":
+        return result
+    if page not in _ADD_HELPER_PAGES:
+        page.add_init_script(_JS_ADD_TO_DATASET_HELPER)
+        _ADD_HELPER_PAGES.add(page)
+    return page.evaluate(_JS_ADD_TO_DATASET, args)
+
+
+def _visible_handle(page: Page, selector: str):
+    """
+    ElementHandle for the first match of ``selector`` if it is visible, else None.
+
+    Lets a check-then-read-then-click step resolve the selector once instead
+    of once per Locator call.  The caller disposes the handle.
+    """
+    handle = page.query_selector(selector)
+    if handle is not None and not handle.is_visible():
+        handle.dispose()
+        return None
+    return handle
+
+
 def add_to_dataset(page: Page, *, image_count: int = 0, config=None) -> bool:
     """
     Click 'Add N images to Dataset' button, then confirm in the modal.
 
     P4: timeout scales with image_count.
     P2: reload recovery if button doesn't appear.
+
+    The happy path runs as one in-page script (``_JS_ADD_TO_DATASET``); the
+    locator steps below only run when that script stalls or throws.
     """
     if config is None:
         config = {}
@@ -1610,24 +2347,39 @@ def add_to_dataset(page: Page, *, image_count: int = 0, config=None) -> bool:
     try:
         _dismiss_overlays(page)
 
-        # Navigate to Annotated tab
-        annotated_tab = page.locator(
-            f"{DETAIL_VIEW} .AnnotationJobImageList button:has-text('Annotated')"
-        ).first
-        if annotated_tab.count() > 0 and annotated_tab.is_visible():
+        stage = None
+        try:
+            skill = _run_add_to_dataset_script(
+                page,
+                [DETAIL_VIEW, _MODAL_BTN_ID, _MODAL_BTN_SEL, _DIALOG_SEL, btn_timeout, 30_000, False],
+            )
+        except Exception as e:
+            logger.debug("  add-to-dataset script failed (%s) -- using locators", e)
+        else:
+            if skill.get("ok"):
+                logger.info("  Clicked initial: '%s'", skill.get("add"))
+                logger.info("  Confirmed in modal: '%s'", skill.get("modal"))
+                return True
+            stage = skill.get("stage")
+            logger.debug("  add-to-dataset script stalled at '%s' -- using locators", stage)
+
+        # Navigate to Annotated tab.  No separate tab-content wait: the Add
+        # button lives in the content the click reveals, so waiting for it
+        # below covers both.
+        annotated_tab = _loc(page, _ANNOTATED_TAB_SEL)
+        if annotated_tab.is_visible():
             annotated_tab.click(force=True)
-            wait_for_tab_content(page)
 
-        # Find Add button (P4 adaptive timeout)
-        add_btn = page.locator(
-            f"{DETAIL_VIEW} button.btn2.medium.primary:has-text('to Dataset'):not([disabled])"
-        ).first
+        # Find Add button (P4 adaptive timeout).  If the script already
+        # waited the full timeout for it, go straight to the reload.
+        add_btn = _loc(page, _ADD_BTN_SEL)
 
         try:
+            if stage == "add":
+                raise TimeoutError("add button not found by script")
             add_btn.wait_for(state="visible", timeout=btn_timeout)
         except Exception:
             logger.warning(f"  Add button not visible after {btn_timeout}ms -- reloading")
-            _dismiss_overlays(page)
             page.reload(wait_until=WAIT_STRATEGY, timeout=NAV_TIMEOUT)
             _dismiss_overlays(page)
             try:
@@ -1636,29 +2388,24 @@ def add_to_dataset(page: Page, *, image_count: int = 0, config=None) -> bool:
                 capture_diagnostics(page, "add_to_dataset_timeout")
                 return False
 
-        btn_text = add_btn.inner_text().strip()
-        logger.info(f"  Clicking initial: '{btn_text}'")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("  Clicking initial: '%s'", (add_btn.text_content() or "").strip())
         add_btn.click(force=True)
 
-        # Confirm in modal
-        modal_btn = page.locator(".dialogPanel button.primary, #AddApprovedImagesToDatasetButton").first
-        try:
-            modal_btn.wait_for(state="visible", timeout=30_000)
-        except Exception:
+        # Confirm in modal: wait, click and wait for close in one evaluate
+        confirm_args = [
+            DETAIL_VIEW, _MODAL_BTN_ID, _MODAL_BTN_SEL, _DIALOG_SEL, btn_timeout, 30_000, True,
+        ]
+        confirmed = _run_add_to_dataset_script(page, confirm_args)
+        if not confirmed.get("modal"):
             logger.warning("  Confirm modal did not appear -- retrying click")
-            _dismiss_overlays(page)
+            _dismiss_overlays(page, force=True)
             add_btn.click(force=True)
-            modal_btn.wait_for(state="visible", timeout=30_000)
-
-        modal_text = modal_btn.inner_text().strip()
-        logger.info(f"  Confirming in modal: '{modal_text}'")
-        modal_btn.click()
-
-        try:
-            page.wait_for_selector(".dialogPanel", state="hidden", timeout=30_000)
-        except Exception:
-            pass
+            confirmed = _run_add_to_dataset_script(page, confirm_args)
+            if not confirmed.get("modal"):
+                raise TimeoutError("confirm modal did not appear after 30000ms")
 
+        logger.info("  Confirmed in modal: '%s'", confirmed["modal"])
         return True
 
     except Exception as e:
@@ -1671,6 +2418,27 @@ def add_to_dataset(page: Page, *, image_count: int = 0, config=None) -> bool:
 #  Tab State Tracker (P4: image_count added)
 # =================================================================================
 
+# Clock for the per-tab state timers.  Monotonic, so an NTP step mid-run
+# can't produce a negative time-in-state; history keeps wall-clock stamps.
+_now = time.monotonic
+
+# Tabs holding queued tick lines (TabState.log).  Any WARNING+ record on the
+# shared logger flushes them first, so buffered INFO lines never appear after
+# a warning that was logged later.
+_PENDING_TAB_LOGS: "weakref.WeakSet[TabState]" = weakref.WeakSet()
+
+
+class _FlushTabLogsFirst(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING and _PENDING_TAB_LOGS:
+            for tab in list(_PENDING_TAB_LOGS):
+                tab.flush_logs()
+        return True
+
+
+logger.addFilter(_FlushTabLogsFirst())
+
+
 class TabState:
     """Track the lifecycle of a single processing slot with full history.
 
@@ -1702,10 +2470,40 @@ class TabState:
     LOADING      = "detail_wait"
     ADDING       = "add_clicked"
 
+    # Statuses that are no longer ticked; the orchestrator recycles them.
+    # ERROR is one: an errored slot stops ticking and its recycle branch
+    # retries or blacklists the URL.  _counted/_recycled are the
+    # orchestrator's bookkeeping markers (see mark()).
+    TERMINAL     = frozenset((DONE, ERROR, BLACKLISTED, "_counted", "_recycled"))
+    # States whose repeat ticks only re-check the page; with the DOM-change
+    # feed installed they are skipped while the page is idle.  READY clicks
+    # the Annotated tab once per entry (_tab_clicked) and afterwards only
+    # waits for the Add button.
+    DOM_WAIT     = frozenset((NAVIGATING, DETAIL_WAIT, NULL_CLICKED, CONVERTING,
+                              READY, ADD_CLICKED, CONFIRMING))
+    # States whose next micro-step is usually ready immediately
+    # (vs. CONVERTING/VERIFYING polls).
+    ACTIVE_STEPS = frozenset((PENDING, NAVIGATING, DETAIL_WAIT, SCANNING,
+                              READY, ADD_CLICKED, CONFIRMING))
+
+    # One instance per slot, read on every tick -- no per-instance __dict__.
+    __slots__ = (
+        "job_url", "_short_id", "page", "status", "is_terminal", "headless", "config",
+        "unannotated_count", "image_count", "error_msg", "retry_count",
+        "start_time", "state_entered_at", "card_type",
+        "_null_retry", "_add_retry", "_nav_retries", "_tab_clicked",
+        "last_progress_count", "last_progress_total", "last_progress_time",
+        "history", "phase_times", "_phase_snapshot", "freeze_count", "error_history",
+        "error_count", "consecutive_errors", "tick_count",
+        "dom_feed", "dom_changed_at", "probed_at", "_log_buf",
+        "__weakref__",
+    )
+
     def __init__(self, job_url: str, *, headless: bool = False, config=None):
         self.job_url = job_url
+        self._short_id = job_url.rpartition("/")[2][:8]
         self.page = None
-        self.status = self.PENDING
+        self._set_status(self.PENDING)        # status + is_terminal (status in TERMINAL)
         self.headless = headless
         self.config = config or {}
         self.unannotated_count = 0
@@ -1715,11 +2513,12 @@ class TabState:
         self.start_time = 0.0
 
         # ── Sub-step tracking for non-blocking waits ─────────────────
-        self.state_entered_at = time.time()   # when did we enter current state?
+        self.state_entered_at = _now()        # when did we enter current state?
         self.card_type = None                 # "start_annotating" | "add_to_dataset" | "submit_for_review"
         self._null_retry = 0                  # retries for null click sub-steps
         self._add_retry = 0                   # retries for add-to-dataset sub-steps
         self._nav_retries = 0                 # reload retries during DETAIL_WAIT
+        self._tab_clicked = False             # READY: Annotated tab clicked on this entry
 
         # ── Progress tracking (null conversion) ─────────────────────
         self.last_progress_count = 0
@@ -1727,31 +2526,44 @@ class TabState:
         self.last_progress_time = 0.0
 
         # ── History / observability ──────────────────────────────────
-        self.history: list = []               # [(timestamp, state, message), ...]
-        self.phase_times: dict = {}           # {state_name: total_seconds_spent}
+        self.history = collections.deque(maxlen=200)  # [(timestamp, state, message), ...]
+        self.phase_times = collections.defaultdict(float)  # {state_name: total_seconds_spent}
+        self._phase_snapshot = None           # rounded phase_times for to_dict; None = stale
         self.freeze_count: int = 0            # stall detections
-        self.error_history: list = []         # [error_msg, ...]
+        self.error_history = collections.deque(maxlen=20)  # last error messages
+        self.error_count: int = 0             # all errors, not capped like error_history
         self.consecutive_errors: int = 0      # for blacklist logic
         self.tick_count: int = 0              # how many ticks this tab has seen
 
+        # ── DOM-change feed (see _install_dom_change_feed) ───────────
+        self.dom_feed: bool = False           # feed installed on the current page
+        self.dom_changed_at: float = 0.0      # last change reported by the page
+        self.probed_at: float = 0.0           # last tick that actually probed
+
+        # ── Tick log buffer (see log / flush_logs) ──────────────────
+        self._log_buf = collections.deque()   # [(wall time, id, state, msg, args), ...]
+
         self._record_event("created", f"url={job_url}")
 
     # ── State transition helper ──────────────────────────────────────
     def transition(self, new_status: str, message: str = "") -> None:
         """Transition to a new state, recording timing + history."""
-        now = time.time()
+        now = _now()
         elapsed = now - self.state_entered_at
         old = self.status
 
         # Accumulate time in old state
-        self.phase_times[old] = self.phase_times.get(old, 0) + elapsed
+        self.phase_times[old] += elapsed
+        self._phase_snapshot = None
 
-        self.status = new_status
+        self._set_status(new_status)
         self.state_entered_at = now
+        self._tab_clicked = False
 
         if new_status == self.ERROR:
             self.error_msg = message
             self.error_history.append(message)
+            self.error_count += 1
             self.consecutive_errors += 1
         elif new_status == self.DONE:
             self.consecutive_errors = 0
@@ -1760,25 +2572,23 @@ class TabState:
 
     def _record_event(self, state: str, msg: str) -> None:
         self.history.append((time.time(), state, msg))
-        # Keep history bounded
-        if len(self.history) > 200:
-            self.history = self.history[-100:]
 
     @property
     def time_in_state(self) -> float:
         """Seconds spent in the current state so far."""
-        return time.time() - self.state_entered_at
+        return _now() - self.state_entered_at
 
     @property
     def total_elapsed(self) -> float:
         """Seconds since this tab was first created or last reset."""
-        return time.time() - self.start_time if self.start_time else 0.0
+        return _now() - self.start_time if self.start_time else 0.0
 
     # ── Reset / cleanup ──────────────────────────────────────────────
     def reset_for(self, job_url: str, *, is_retry: bool = False) -> None:
         self.job_url = job_url
-        self.status = self.PENDING
-        self.state_entered_at = time.time()
+        self._short_id = job_url.rpartition("/")[2][:8]
+        self._set_status(self.PENDING)
+        self.state_entered_at = _now()
         self.unannotated_count = 0
         self.image_count = 0
         self.error_msg = ""
@@ -1790,6 +2600,7 @@ class TabState:
         self._null_retry = 0
         self._add_retry = 0
         self._nav_retries = 0
+        self._tab_clicked = False
         self.freeze_count = 0
         self.tick_count = 0
         if is_retry:
@@ -1799,23 +2610,76 @@ class TabState:
             self.consecutive_errors = 0
         self._record_event("reset", f"url={job_url} retry={is_retry}")
 
+    def log(self, msg: str, *args) -> None:
+        """Queue an info line for this tab; emitted by flush_logs().
+
+        Formatting is left to logging at the flush, and skipped entirely when
+        INFO is disabled.  The time and tab label are captured now, so a line
+        keeps the time and state it was logged in.
+        """
+        if not self._log_buf:
+            _PENDING_TAB_LOGS.add(self)
+        self._log_buf.append((time.time(), self._short_id, self.status, msg, args))
+
+    def flush_logs(self) -> None:
+        """Emit the queued tick lines as one multi-line INFO record, stamped
+        with the time of the first line."""
+        buf = self._log_buf
+        if not buf:
+            return
+        _PENDING_TAB_LOGS.discard(self)
+        lines = list(buf)
+        buf.clear()
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        fmt, fmt_args = [], []
+        for _, sid, status, msg, args in lines:
+            fmt.append("  Tab(%s…, %s): " + (msg if args else msg.replace("%", "%%")))
+            fmt_args += (sid, status, *args)
+        record = logger.makeRecord(
+            logger.name, logging.INFO, __file__, 0, "\n".join(fmt), tuple(fmt_args), None,
+        )
+        record.created = lines[0][0]
+        record.msecs = (record.created % 1) * 1000
+        logger.handle(record)
+
+    def _set_status(self, status: str) -> None:
+        """The only writer of status, keeping the cached is_terminal in step."""
+        self.status = status
+        self.is_terminal = status in self.TERMINAL
+
+    def mark(self, marker: str) -> None:
+        """Set an orchestrator bookkeeping status (``_counted``, ``_recycled``,
+        BLACKLISTED) directly -- no timing or history, the slot just waits
+        to be recycled."""
+        self._set_status(marker)
+
     def close_page(self) -> None:
         try:
             if self.page and not self.page.is_closed():
                 self.page.close()
         except Exception:
             pass
+        if self.page is not None:
+            _LOCATORS.pop(self.page, None)
         self.page = None
+        self.dom_feed = False
 
     @property
     def short_id(self) -> str:
-        return self.job_url.split("/")[-1][:8]
+        return self._short_id
 
     def __repr__(self):
         return f"Tab({self.short_id}…, {self.status})"
 
     def to_dict(self) -> dict:
-        """Serialize tab state for dashboard/logging."""
+        """Serialize tab state for dashboard/logging.
+
+        The rounded phase_times only change on a transition, so that part is
+        built once per transition and shared (read-only) between snapshots.
+        """
+        if self._phase_snapshot is None:
+            self._phase_snapshot = {k: round(v, 1) for k, v in self.phase_times.items()}
         return {
             "short_id": self.short_id,
             "status": self.status,
@@ -1826,11 +2690,11 @@ class TabState:
             "image_count": self.image_count,
             "unannotated": self.unannotated_count,
             "error_msg": self.error_msg,
-            "errors": len(self.error_history),
+            "errors": self.error_count,
             "freezes": self.freeze_count,
             "card_type": self.card_type,
             "retry": self.retry_count,
-            "phase_times": {k: round(v, 1) for k, v in self.phase_times.items()},
+            "phase_times": self._phase_snapshot,
             "history_len": len(self.history),
         }
 
@@ -1844,21 +2708,130 @@ class TabState:
 #  the next tab immediately — no tab ever blocks the loop.
 #
 
+# Page-side change feed: a MutationObserver that calls the exposed
+# __rfDomChanged binding, throttled to once per 250 ms while the DOM keeps
+# changing and silent while it is idle.
+_JS_DOM_CHANGE_FEED = """
+(() => {
+    if (window.__rfDomFeed) return;
+    window.__rfDomFeed = true;
+    let queued = false;
+    const notify = () => {
+        queued = false;
+        try { window.__rfDomChanged(); } catch (e) {}
+    };
+    new MutationObserver(() => {
+        if (!queued) { queued = true; setTimeout(notify, 250); }
+    }).observe(document.documentElement || document, {
+        childList: true, subtree: true, attributes: true, characterData: true,
+    });
+})()
+"""
+
+_JS_CLOSE_DIALOGS = "() => document.querySelectorAll('.dialogPanel').forEach(el => el.remove())"
+
+# The per-tick scripts, installed once per document as window.__rf so each
+# tick sends only a short call stub (see _call_page_helper).
+_JS_PAGE_HELPERS = """
+(() => {
+    if (window.__rf) return;
+    window.__rf = {
+        probeGates: """ + _JS_PROBE_DETAIL_GATES.strip() + """,
+        processingProgress: """ + _JS_PROCESSING_PROGRESS.strip() + """,
+        dismissOverlays: """ + _JS_DISMISS_OVERLAYS.strip() + """,
+        closeDialogs: """ + _JS_CLOSE_DIALOGS + """,
+    };
+})()
+"""
+_RF_MISSING = "__rf-missing"
+_JS_CALL_PAGE_HELPER = (
+    "([name, arg]) => window.__rf ? window.__rf[name](arg) : '" + _RF_MISSING + "'"
+)
+_PAGE_HELPER_PAGES: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+
+def _install_page_helpers(page: Page) -> None:
+    """Register _JS_PAGE_HELPERS for every future document of ``page``."""
+    if page in _PAGE_HELPER_PAGES:
+        return
+    try:
+        page.add_init_script(_JS_PAGE_HELPERS)
+        _PAGE_HELPER_PAGES.add(page)
+    except Exception as e:
+        logger.debug("  page helpers not installed: %s", e)
+
+
+def _call_page_helper(page: Page, name: str, script: str, arg=None):
+    """Call window.__rf[name](arg); evaluate ``script`` itself where the
+    current document has no helpers (page not set up by tick_pending, or
+    loaded before registration)."""
+    result = page.evaluate(_JS_CALL_PAGE_HELPER, [name, arg])
+    if result == _RF_MISSING:
+        return page.evaluate(script, arg)
+    return result
+
+
+# A DOM_WAIT tick is skipped only while nothing changed since the last probe,
+# and at most this long, so time-based recovery (reload, stall, timeout)
+# still runs on a page that never changes.
+_IDLE_TICK_MAX_S = 2.0
+
+
+def _install_dom_change_feed(tab: TabState) -> None:
+    """Expose __rfDomChanged on ``tab.page`` and register the observer script.
+
+    Must run before the page's next navigation.  On failure the tab simply
+    keeps being ticked every round.
+    """
+    page = tab.page
+
+    def _on_change(source) -> None:
+        tab.dom_changed_at = _now()
+
+    try:
+        page.expose_binding("__rfDomChanged", _on_change)
+        page.add_init_script(_JS_DOM_CHANGE_FEED)
+        tab.dom_feed = True
+    except Exception as e:
+        logger.debug("  %s: DOM change feed not installed: %s", tab, e)
+
+
+def _idle_wait(slots, seconds: float) -> None:
+    """Pause between rounds while still dispatching page events.
+
+    page.wait_for_timeout (not time.sleep) keeps Playwright's dispatcher
+    running, so DOM-change bindings land during the pause.
+    """
+    for s in slots:
+        page = s.page
+        if page is not None and not page.is_closed():
+            try:
+                page.wait_for_timeout(seconds * 1000)
+                return
+            except Exception:
+                continue
+    time.sleep(seconds)
+
+
 def tick_pending(tab: TabState, context: BrowserContext) -> None:
     """PENDING → NAVIGATING: Open page and fire navigation (goto blocks briefly)."""
     try:
         if tab.retry_count > 0:
-            logger.info(f"  {tab}: Retry #{tab.retry_count} — opening fresh tab (P2 L4)")
+            tab.log("Retry #%d — opening fresh tab (P2 L4)", tab.retry_count)
             tab.close_page()
 
         if tab.page is None or tab.page.is_closed():
             tab.page = context.new_page()
+            tab.dom_feed = False
+        if not tab.dom_feed:
+            _install_dom_change_feed(tab)
+        _install_page_helpers(tab.page)
 
         # Use "commit" so goto returns as soon as first byte arrives (~1-3 s)
         tab.page.goto(tab.job_url, wait_until="commit", timeout=NAV_TIMEOUT)
-        tab.start_time = time.time()
+        tab.start_time = _now()
         tab.transition(TabState.NAVIGATING, "goto fired")
-        logger.info(f"  Opened: {tab}")
+        tab.log("Opened")
     except Exception as e:
         logger.error(f"  Failed to open {tab.job_url}: {e}")
         tab.transition(TabState.ERROR, str(e))
@@ -1875,8 +2848,8 @@ def tick_navigating(tab: TabState) -> None:
             return
 
         # Quick probe — is the detail view wrapper visible yet?
-        detail = page.locator(DETAIL_VIEW)
-        if detail.count() > 0 and detail.first.is_visible():
+        detail = _loc(page, DETAIL_VIEW)
+        if detail.is_visible():
             tab.transition(TabState.DETAIL_WAIT, "detail view appeared")
             return
 
@@ -1889,74 +2862,64 @@ def tick_navigating(tab: TabState) -> None:
 
 
 def tick_detail_wait(tab: TabState) -> None:
-    """DETAIL_WAIT → SCANNING: Quick-check if card is fully loaded (all 5 gates)."""
+    """DETAIL_WAIT → SCANNING: Quick-check if card is fully loaded (all 5 gates).
+
+    All gates are read with one evaluate (_JS_PROBE_DETAIL_GATES); a gate
+    that isn't ready yet just returns so the next tab gets its turn.
+    """
     try:
         page = tab.page
         _dismiss_overlays(page)
+        gates = _call_page_helper(page, "probeGates", _JS_PROBE_DETAIL_GATES, tab.headless)
 
-        # Gate 1: progress legend (instant check)
-        progress_sel = f"{DETAIL_VIEW} .AnnotationJobProgressLegend"
-        if page.locator(progress_sel).count() == 0 or not page.locator(progress_sel).first.is_visible():
+        # Gate 1: progress legend
+        if not gates or not gates["legend"]:
             if tab.time_in_state > CARD_LOAD_TIMEOUT / 1000:
                 # One reload recovery attempt
                 if tab._nav_retries < 1:
                     tab._nav_retries += 1
-                    logger.info(f"  {tab}: Progress legend missing — reload recovery")
+                    tab.log("Progress legend missing — reload recovery")
                     try:
                         page.reload(wait_until=WAIT_STRATEGY, timeout=NAV_TIMEOUT)
                     except Exception:
                         pass
-                    tab.state_entered_at = time.time()  # reset timer
+                    tab.state_entered_at = _now()  # reset timer
                 else:
                     tab.transition(TabState.ERROR, "Card detail never fully loaded")
                     capture_diagnostics(page, f"card_not_loaded_{tab.short_id}")
             return  # not ready yet — jump to next tab
 
         # Gate 2: image list tab bar
-        img_list = f"{DETAIL_VIEW} .AnnotationJobImageList"
-        if page.locator(img_list).count() == 0 or not page.locator(img_list).first.is_visible():
+        if not gates["imgList"]:
             if tab.time_in_state > CARD_LOAD_TIMEOUT / 1000:
                 tab.transition(TabState.ERROR, "Image list tab bar never appeared")
                 capture_diagnostics(page, f"img_list_timeout_{tab.short_id}")
             return
 
-        # Gate 3: image grid (quick with short timeout)
-        image_grid_sel = (
-            f"{DETAIL_VIEW} #annotationContainer .ImageCard, "
-            f"{DETAIL_VIEW} .AnnotationJobImageList .ImageItem"
-        )
-        gate_state = "attached" if tab.headless else "visible"
-        grid = page.locator(image_grid_sel)
-        try:
-            grid.first.wait_for(state=gate_state, timeout=QUICK_CHECK_MS)
-        except Exception:
+        # Gate 3: image grid
+        if not gates["grid"]:
+            gate_state = "attached" if tab.headless else "visible"
             if tab.time_in_state > CARD_LOAD_TIMEOUT / 1000:
                 if tab._nav_retries < 1:
                     tab._nav_retries += 1
-                    logger.info(f"  {tab}: Image grid missing — reload recovery")
+                    tab.log("Image grid missing — reload recovery")
                     try:
                         page.reload(wait_until=WAIT_STRATEGY, timeout=NAV_TIMEOUT)
                     except Exception:
                         pass
-                    tab.state_entered_at = time.time()
+                    tab.state_entered_at = _now()
                 else:
                     tab.transition(TabState.ERROR, f"Image grid not {gate_state}")
                     capture_diagnostics(page, f"grid_timeout_{tab.short_id}")
             return
 
         # Gate 4: read image count (P4)
-        try:
-            header_text = page.locator(
-                ".AnnotationJobDetailView h1, .AnnotationJobDetailView .text-xl"
-            ).first.inner_text()
-            img_m = re.search(r"(\d+)\s+[Ii]mage", header_text)
-            if img_m:
-                tab.image_count = int(img_m.group(1))
-        except Exception:
-            tab.image_count = 0
+        img_m = _RE_IMAGE_HEADER.search(gates["header"])
+        if img_m:
+            tab.image_count = int(img_m.group(1))
 
-        # Gate 5: detect card type (instant button check)
-        tab.card_type = _detect_card_type(page, headless=tab.headless)
+        # Gate 5: card type from the action button
+        tab.card_type = gates["action"][0] if gates["action"] else None
         if tab.card_type is None:
             if tab.time_in_state > CARD_LOAD_TIMEOUT / 1000:
                 tab.transition(TabState.ERROR, "Card type unclassified")
@@ -1965,7 +2928,7 @@ def tick_detail_wait(tab: TabState) -> None:
 
         # All gates passed — move to SCANNING
         tab.transition(TabState.SCANNING, f"card_type={tab.card_type}")
-        logger.info(f"  {tab}: Card loaded — type={tab.card_type}, images={tab.image_count}")
+        tab.log("Card loaded — type=%s, images=%d", tab.card_type, tab.image_count)
 
     except Exception as e:
         tab.transition(TabState.ERROR, f"detail_wait error: {e}")
@@ -1980,14 +2943,14 @@ def tick_scanning(tab: TabState) -> None:
 
         # Cards that don't need null conversion go straight to READY
         if tab.card_type in ("add_to_dataset", "submit_for_review"):
-            logger.info(f"  {tab}: Pure annotated/review card → straight to READY")
+            tab.log("Pure annotated/review card → straight to READY")
             tab.unannotated_count = 0
             tab.transition(TabState.READY)
             return
 
         # Read unannotated count (instant DOM read)
         tab.unannotated_count = get_unannotated_count(page)
-        logger.info(f"  {tab}: {tab.unannotated_count} unannotated images")
+        tab.log("%d unannotated images", tab.unannotated_count)
 
         if tab.unannotated_count == 0:
             tab.transition(TabState.READY)
@@ -1998,7 +2961,7 @@ def tick_scanning(tab: TabState) -> None:
         success = _click_null_button_fast(page, tab.config)
         if success:
             tab.transition(TabState.NULL_CLICKED, "null button clicked")
-            logger.info(f"  {tab}: Null button clicked — jumping to next tab")
+            tab.log("Null button clicked — jumping to next tab")
         else:
             tab._null_retry += 1
             if tab._null_retry >= 3:
@@ -2006,7 +2969,7 @@ def tick_scanning(tab: TabState) -> None:
                 logger.warning(f"  {tab}: Null click failed {tab._null_retry}x — skipping to READY")
                 tab.transition(TabState.READY, "null click exhausted, proceeding")
             else:
-                logger.info(f"  {tab}: Null click attempt {tab._null_retry} failed — will retry next round")
+                tab.log("Null click attempt %d failed — will retry next round", tab._null_retry)
 
     except Exception as e:
         tab.transition(TabState.ERROR, f"scanning error: {e}")
@@ -2020,17 +2983,17 @@ def tick_null_clicked(tab: TabState) -> None:
         page = tab.page
 
         # Did SweetAlert confirmation appear?
-        swal = page.locator(".swal2-popup")
-        if swal.count() > 0 and swal.first.is_visible():
+        swal = _loc(page, _SWAL_POPUP_SEL)
+        if swal.is_visible():
             # Check if it's the confirmation dialog (has confirm button)
-            confirm_btn = page.locator("button.swal2-confirm")
-            if confirm_btn.count() > 0 and confirm_btn.first.is_visible():
+            confirm_btn = _loc(page, _SWAL_CONFIRM_SEL)
+            if confirm_btn.is_visible():
                 # Click "Mark null" confirm
-                confirm_btn.first.click()
-                logger.info(f"  {tab}: Confirmed 'Mark null' — processing started")
+                confirm_btn.click()
+                tab.log("Confirmed 'Mark null' — processing started")
                 tab.last_progress_count = 0
                 tab.last_progress_total = 0
-                tab.last_progress_time = time.time()
+                tab.last_progress_time = _now()
                 tab.transition(TabState.CONVERTING, "null conversion confirmed")
                 return
 
@@ -2038,11 +3001,11 @@ def tick_null_clicked(tab: TabState) -> None:
             # already started (e.g. progress dialog). Check for progress text.
             progress_text = ""
             try:
-                progress_text = page.locator("#swal2-content .text-sm.text-gray-500").first.inner_text()
+                progress_text = _loc(page, _SWAL_PROGRESS_SEL).inner_text()
             except Exception:
                 pass
             if "of" in progress_text:
-                tab.last_progress_time = time.time()
+                tab.last_progress_time = _now()
                 tab.transition(TabState.CONVERTING, "conversion already running")
                 return
 
@@ -2056,7 +3019,7 @@ def tick_null_clicked(tab: TabState) -> None:
                 logger.warning(f"  {tab}: SweetAlert timeout — retry null click #{tab._null_retry}")
                 _dismiss_overlays(page)
                 _click_null_button_fast(page, tab.config)
-                tab.state_entered_at = time.time()
+                tab.state_entered_at = _now()
             else:
                 logger.warning(f"  {tab}: SweetAlert never appeared — skipping to READY")
                 tab.transition(TabState.READY, "swal timeout, skipping null")
@@ -2073,7 +3036,7 @@ def tick_converting(tab: TabState) -> None:
     P4: stall timeout scales with tab.image_count.
     """
     try:
-        now = time.time()
+        now = _now()
         elapsed = now - tab.start_time
         done, progress, current, total = is_processing_complete(tab.page)
 
@@ -2094,18 +3057,18 @@ def tick_converting(tab: TabState) -> None:
             capture_diagnostics(tab.page, f"progress_stalled_{tab.short_id}")
             return
 
-        if total > 0 and current > 0 and not done:
+        if total > 0 and current > 0 and not done and logger.isEnabledFor(logging.INFO):
             pct = (current / total) * 100
             rate = current / max(elapsed, 1)
             remaining = (total - current) / rate if rate > 0 else 0
-            logger.info(
-                f"  {tab}: {current}/{total} ({pct:.1f}%) — "
-                f"~{remaining / 60:.1f}min remaining  (stall budget: {stall_limit - stall_duration:.0f}s)"
+            tab.log(
+                "%d/%d (%.1f%%) — ~%.1fmin remaining  (stall budget: %.0fs)",
+                current, total, pct, remaining / 60, stall_limit - stall_duration,
             )
 
         if done:
-            logger.info(f"  ✓ {tab}: Processing complete! ({progress})")
-            dismiss_swal_if_present(tab.page)
+            tab.log("✓ Processing complete! (%s)", progress)
+            _dismiss_overlays(tab.page)  # one evaluate; no fixed 500 ms settle
             tab.transition(TabState.READY, "conversion complete")
 
     except Exception as e:
@@ -2120,29 +3083,25 @@ def tick_ready(tab: TabState) -> None:
         page = tab.page
         _dismiss_overlays(page)
 
-        # Navigate to Annotated tab
-        annotated_tab = page.locator(
-            f"{DETAIL_VIEW} .AnnotationJobImageList button:has-text('Annotated')"
-        ).first
-        if annotated_tab.count() > 0 and annotated_tab.is_visible():
-            annotated_tab.click(force=True)
-            # Quick wait for tab content — short timeout
-            try:
-                page.wait_for_selector(
-                    f"{DETAIL_VIEW} #annotationContainer",
-                    state="attached", timeout=QUICK_CHECK_MS,
-                )
-            except Exception:
-                pass
+        # Navigate to Annotated tab, once per entry into READY (the click
+        # itself changes the DOM and would re-tick us).  No wait for its
+        # content here: if the Add button isn't rendered yet the tick
+        # returns, and the DOM-change feed re-ticks this tab once it lands.
+        if not tab._tab_clicked:
+            annotated_tab = _loc(page, _ANNOTATED_TAB_SEL)
+            if annotated_tab.is_visible():
+                annotated_tab.click(force=True)
+                tab._tab_clicked = True
 
-        # Find and click Add button
-        add_btn = page.locator(
-            f"{DETAIL_VIEW} button.btn2.medium.primary:has-text('to Dataset'):not([disabled])"
-        ).first
-        if add_btn.count() > 0 and add_btn.is_visible():
-            btn_text = add_btn.inner_text().strip()
-            logger.info(f"  {tab}: Clicking '{btn_text}'")
-            add_btn.click(force=True)
+        # Click Add button
+        add_handle = _visible_handle(page, _ADD_BTN_SEL)
+        if add_handle is not None:
+            try:
+                btn_text = (add_handle.text_content() or "").strip()
+                tab.log("Clicking '%s'", btn_text)
+                add_handle.click(force=True)
+            finally:
+                add_handle.dispose()
             tab.transition(TabState.ADD_CLICKED, f"clicked: {btn_text}")
             return
 
@@ -2152,12 +3111,12 @@ def tick_ready(tab: TabState) -> None:
             if tab._add_retry < 1:
                 tab._add_retry += 1
                 logger.warning(f"  {tab}: Add button not visible — reload recovery")
-                _dismiss_overlays(page)
                 try:
                     page.reload(wait_until=WAIT_STRATEGY, timeout=NAV_TIMEOUT)
                 except Exception:
                     pass
-                tab.state_entered_at = time.time()
+                tab.state_entered_at = _now()
+                tab._tab_clicked = False  # the reload resets the active tab
             else:
                 tab.transition(TabState.ERROR, "Add button never appeared")
                 capture_diagnostics(page, f"add_btn_timeout_{tab.short_id}")
@@ -2172,14 +3131,15 @@ def tick_add_clicked(tab: TabState) -> None:
     """ADD_CLICKED → CONFIRMING: Quick-check if confirm modal appeared, click it."""
     try:
         page = tab.page
-        modal_btn = page.locator(
-            ".dialogPanel button.primary, #AddApprovedImagesToDatasetButton"
-        ).first
-
-        if modal_btn.count() > 0 and modal_btn.is_visible():
-            modal_text = modal_btn.inner_text().strip()
-            logger.info(f"  {tab}: Confirming modal: '{modal_text}'")
-            modal_btn.click()
+        modal_handle = _visible_handle(page, _MODAL_BTN_SEL)
+
+        if modal_handle is not None:
+            try:
+                modal_text = (modal_handle.text_content() or "").strip()
+                tab.log("Confirming modal: '%s'", modal_text)
+                modal_handle.click()
+            finally:
+                modal_handle.dispose()
             tab.transition(TabState.CONFIRMING, f"confirmed: {modal_text}")
             return
 
@@ -2189,12 +3149,10 @@ def tick_add_clicked(tab: TabState) -> None:
                 tab._add_retry += 1
                 logger.warning(f"  {tab}: Confirm modal timeout — re-clicking add button")
                 _dismiss_overlays(page)
-                add_btn = page.locator(
-                    f"{DETAIL_VIEW} button.btn2.medium.primary:has-text('to Dataset'):not([disabled])"
-                ).first
-                if add_btn.count() > 0 and add_btn.is_visible():
+                add_btn = _loc(page, _ADD_BTN_SEL)
+                if add_btn.is_visible():
                     add_btn.click(force=True)
-                tab.state_entered_at = time.time()
+                tab.state_entered_at = _now()
             else:
                 tab.transition(TabState.ERROR, "Confirm modal never appeared")
                 capture_diagnostics(page, f"modal_timeout_{tab.short_id}")
@@ -2209,9 +3167,9 @@ def tick_confirming(tab: TabState) -> None:
     """CONFIRMING → VERIFYING: Quick-check if modal closed."""
     try:
         page = tab.page
-        dialog = page.locator(".dialogPanel")
+        dialog = _loc(page, _DIALOG_SEL)
 
-        if dialog.count() == 0 or not dialog.first.is_visible():
+        if not dialog.is_visible():
             tab.transition(TabState.VERIFYING, "modal closed")
             return
 
@@ -2219,9 +3177,7 @@ def tick_confirming(tab: TabState) -> None:
             # Force-close and proceed
             logger.warning(f"  {tab}: Modal still open after 30s — assuming success")
             try:
-                page.evaluate(
-                    "() => document.querySelectorAll('.dialogPanel').forEach(el => el.remove())"
-                )
+                _call_page_helper(page, "closeDialogs", _JS_CLOSE_DIALOGS)
             except Exception:
                 pass
             tab.transition(TabState.VERIFYING, "modal force-closed")
@@ -2231,17 +3187,33 @@ def tick_confirming(tab: TabState) -> None:
         tab.transition(TabState.VERIFYING, f"modal check error (assuming ok): {e}")
 
 
+# How long VERIFYING waits for the server's own redirect off the job page
+# before falling back to a full goto(job_url) to check it.
+_VERIFY_REDIRECT_S = 5.0
+
+
+def _left_job_page(url: str) -> bool:
+    return not _ANNOTATE_JOB_URL_RE.search(url)
+
+
 def tick_verifying(tab: TabState, coordinator) -> None:
-    """VERIFYING → DONE: Server verification after add-to-dataset."""
+    """VERIFYING → DONE: Server verification after add-to-dataset.
+
+    After a successful add the server usually redirects the page to the
+    board by itself, so each tick just reads page.url and returns while the
+    redirect is pending; only past _VERIFY_REDIRECT_S does it navigate.
+    """
     try:
         page = tab.page
 
-        # P1 L3: navigate to job URL and check redirect
+        # P1 L3: check for the redirect; navigate only if it never came
         try:
-            page.goto(tab.job_url, wait_until=WAIT_STRATEGY, timeout=15_000)
-            final_url = page.url
-            if "/annotate/job/" not in final_url:
-                logger.info(f"  ✓ {tab}: Server confirmed done (redirected to board)")
+            if not _left_job_page(page.url):
+                if tab.time_in_state < _VERIFY_REDIRECT_S:
+                    return  # still on the job page — check again next round
+                page.goto(tab.job_url, wait_until=WAIT_STRATEGY, timeout=15_000)
+            if _left_job_page(page.url):
+                tab.log("✓ Server confirmed done (redirected to board)")
             else:
                 logger.warning(f"  {tab}: Job still accessible after add — treating as done")
         except Exception as ve:
@@ -2249,47 +3221,13 @@ def tick_verifying(tab: TabState, coordinator) -> None:
 
         coordinator.mark_done(tab.job_url)
         tab.transition(TabState.DONE, "added to dataset")
-        logger.info(f"  ✓ {tab}: Added to dataset ✓")
+        tab.log("✓ Added to dataset ✓")
 
     except Exception as e:
         # Even if verification fails, the add was likely successful
         coordinator.mark_done(tab.job_url)
         tab.transition(TabState.DONE, f"done (verify error: {e})")
-        logger.info(f"  ✓ {tab}: Added to dataset (verify skipped)")
-
-
-# ── Fast helper: detect card type without blocking ───────────────────────
-def _detect_card_type(page: Page, *, headless: bool = False) -> str | None:
-    """Instant card-type detection via button visibility. Returns type or None."""
-    detail = DETAIL_VIEW
-
-    def _btn_check(selector: str) -> bool:
-        loc = page.locator(selector).first
-        if loc.count() == 0:
-            return False
-        if loc.is_visible() and loc.is_enabled():
-            return True
-        if headless:
-            try:
-                return loc.is_enabled()
-            except Exception:
-                pass
-        return False
-
-    for btn_text in ("Start Annotating", "Continue Annotating"):
-        sel = f"{detail} button.btn2.medium:has-text('{btn_text}')"
-        if _btn_check(sel):
-            return "start_annotating"
-
-    add_sel = f"{detail} button.btn2.medium.primary:has-text('to Dataset'):not([disabled])"
-    if _btn_check(add_sel):
-        return "add_to_dataset"
-
-    review_sel = f"{detail} button.btn2.medium:has-text('Submit for Review')"
-    if _btn_check(review_sel):
-        return "submit_for_review"
-
-    return None
+        tab.log("✓ Added to dataset (verify skipped)")
 
 
 # ── Fast helper: click null button without long waits ────────────────────
@@ -2299,25 +3237,22 @@ def _click_null_button_fast(page: Page, config: dict) -> bool:
         _dismiss_overlays(page)
 
         # Click Unannotated tab
-        unannotated_tab = page.locator(
-            f"{DETAIL_VIEW} .AnnotationJobImageList button:has-text('Unannotated')"
-        ).first
-        if unannotated_tab.count() > 0 and unannotated_tab.is_visible():
+        unannotated_tab = _loc(page, _UNANNOTATED_TAB_SEL)
+        if unannotated_tab.is_visible():
             unannotated_tab.click()
             # Short wait for content
             try:
                 page.wait_for_selector(
-                    f"{DETAIL_VIEW} #annotationContainer",
-                    state="attached", timeout=QUICK_CHECK_MS,
+                    _IMAGE_CONTAINER_SEL, state="attached", timeout=QUICK_CHECK_MS,
                 )
             except Exception:
                 pass
 
-        _dismiss_overlays(page)
+        _dismiss_overlays(page, force=True)
 
         # Click Null button
-        null_btn = page.locator(f"{DETAIL_VIEW} button:has(i.far.fa-empty-set)").first
-        if null_btn.count() > 0 and null_btn.is_visible() and not null_btn.is_disabled():
+        null_btn = _loc(page, _NULL_BTN_SEL)
+        if null_btn.is_visible() and not null_btn.is_disabled():
             null_btn.click()
             return True
 
@@ -2351,14 +3286,12 @@ def scan_unannotated_robustly(page: Page) -> int:
 
     # Fallback: check Null button state
     try:
-        unannotated_tab = page.locator(
-            f"{DETAIL_VIEW} .AnnotationJobImageList button:has-text('Unannotated')"
-        ).first
+        unannotated_tab = _loc(page, _UNANNOTATED_TAB_SEL)
         if unannotated_tab.is_visible():
             unannotated_tab.click()
             wait_for_tab_content(page)
 
-        null_btn = page.locator(f"{DETAIL_VIEW} button:has(i.far.fa-empty-set)").first
+        null_btn = _loc(page, _NULL_BTN_SEL)
         if null_btn.is_visible() and not null_btn.is_disabled():
             logger.info("  Null button is ENABLED -> unannotated images exist.")
             return 1
@@ -2400,8 +3333,8 @@ def run_dataset_mover(
 
     page.set_default_timeout(NAV_TIMEOUT)
 
-    # Install Firestore fetch() intercept before first navigation so
-    # add_init_script fires on every subsequent page load (incl. Tier 0 reloads).
+    # Install the Firestore request listener before first navigation so the
+    # initial board load's subscriptions are seen too (and every Tier 0 reload).
     if config.get("use_network_tier0", True):
         _install_firestore_intercept(page, config)
 
@@ -2662,24 +3595,21 @@ def _run_pipeline(
 
     while True:
         # ── Check termination: all slots finished and queue empty ─────
-        active = [
-            s for s in slots
-            if s.status not in (TabState.DONE, TabState.ERROR, TabState.BLACKLISTED)
-            and not s.status.startswith("_")   # _counted / _recycled are done
-        ]
+        active = [s for s in slots if not s.is_terminal]
         if not active and not queue:
             break
 
         round_num += 1
         any_converting = False
+        progressed = False   # any slot changed state / picked up work this round
 
         for slot in slots:
             # ── Recycle finished/errored slots ────────────────────────
-            if slot.status in (TabState.DONE, TabState.ERROR, TabState.BLACKLISTED):
+            if slot.is_terminal:
                 if slot.status == TabState.DONE:
                     moved += 1
                     slot.transition(TabState.DONE, "counted")  # prevent double-count
-                    slot.status = "_counted"  # internal marker
+                    slot.mark("_counted")  # internal marker
                 elif slot.status == TabState.ERROR:
                     failed_url = slot.job_url
                     retries = retry_tracker.get(failed_url, 0)
@@ -2693,7 +3623,7 @@ def _run_pipeline(
                             f"  ✗ BLACKLISTED {slot} after {slot.consecutive_errors} "
                             f"consecutive errors: {slot.error_msg}"
                         )
-                        slot.status = TabState.BLACKLISTED
+                        slot.mark(TabState.BLACKLISTED)
                     elif retries < MAX_CARD_RETRIES:
                         retry_tracker[failed_url] = retries + 1
                         queue.append(failed_url)
@@ -2701,7 +3631,7 @@ def _run_pipeline(
                             f"  Re-queuing {slot} for retry "
                             f"({retries + 1}/{MAX_CARD_RETRIES}): {slot.error_msg}"
                         )
-                        slot.status = "_recycled"
+                        slot.mark("_recycled")
                     else:
                         permanently_failed.append(failed_url)
                         coordinator.mark_failed(failed_url, slot.error_msg)
@@ -2709,7 +3639,7 @@ def _run_pipeline(
                             f"  ✗ Giving up on {slot} after {MAX_CARD_RETRIES} retries: "
                             f"{slot.error_msg}"
                         )
-                        slot.status = "_recycled"
+                        slot.mark("_recycled")
                 elif slot.status == TabState.BLACKLISTED:
                     pass  # already handled
 
@@ -2722,6 +3652,7 @@ def _run_pipeline(
                             continue
                         is_retry = next_url in retry_tracker
                         slot.reset_for(next_url, is_retry=is_retry)
+                        progressed = True
                     else:
                         continue  # no more work for this slot
 
@@ -2729,23 +3660,25 @@ def _run_pipeline(
 
             # ── Tick the slot (non-blocking micro-step) ───────────────
             slot.tick_count += 1
-            _tick_slot_fast(slot, context, coordinator=coordinator)
+            status_before = slot.status
+            try:
+                _tick_slot_fast(slot, context, coordinator=coordinator)
+            finally:
+                slot.flush_logs()  # one record per tab per round
+            if slot.status != status_before:
+                progressed = True
 
             if slot.status == TabState.CONVERTING:
                 any_converting = True
 
         # ── Brief sleep between rounds ────────────────────────────────
-        # Longer pause when tabs are converting (nothing to do but poll)
-        if any_converting and not any(
-            s.status in (
-                TabState.PENDING, TabState.NAVIGATING, TabState.DETAIL_WAIT,
-                TabState.SCANNING, TabState.READY, TabState.ADD_CLICKED,
-                TabState.CONFIRMING,
-            ) for s in slots
-        ):
-            time.sleep(POLL_INTERVAL)
-        else:
-            time.sleep(TICK_INTERVAL)
+        # Longer pause when tabs are converting (nothing to do but poll).
+        # No pause at all when a slot advanced this round — its next
+        # micro-step is likely ready now, so go straight to the next round.
+        if any_converting and not any(s.status in TabState.ACTIVE_STEPS for s in slots):
+            _idle_wait(slots, POLL_INTERVAL)
+        elif not progressed:
+            _idle_wait(slots, TICK_INTERVAL)
 
         # ── Periodic status log ───────────────────────────────────────
         if round_num % 20 == 0:
@@ -2769,6 +3702,7 @@ def _run_pipeline(
 
     # ── Final accounting for any remaining slots ──────────────────────
     for slot in slots:
+        slot.flush_logs()
         if slot.status == TabState.DONE:
             moved += 1
         elif slot.status == TabState.ERROR:
@@ -2779,7 +3713,7 @@ def _run_pipeline(
     for slot in slots:
         phases = ", ".join(f"{k}={v:.1f}s" for k, v in slot.phase_times.items() if v > 0)
         logger.debug(
-            f"  Tab {slot.short_id}: ticks={slot.tick_count} errors={len(slot.error_history)} "
+            f"  Tab {slot.short_id}: ticks={slot.tick_count} errors={slot.error_count} "
             f"freezes={slot.freeze_count} phases=[{phases}]"
         )
 
@@ -2817,29 +3751,41 @@ def _tick_slot_fast(
             slot.transition(TabState.DONE, "done by another worker")
             return
 
+    # ── Idle skip: page hasn't changed since this state's last probe ──
+    now = _now()
+    if (
+        slot.dom_feed
+        and slot.status in TabState.DOM_WAIT
+        and slot.state_entered_at < slot.probed_at
+        and slot.dom_changed_at < slot.probed_at
+        and now - slot.probed_at < _IDLE_TICK_MAX_S
+    ):
+        return
+    slot.probed_at = now
+
     # ── Dispatch to the correct micro-tick ────────────────────────────
-    if slot.status == TabState.PENDING:
+    tick = _SLOT_TICKS.get(slot.status)
+    if tick is not None:
+        tick(slot)
+    elif slot.status == TabState.PENDING:
         tick_pending(slot, context)
-    elif slot.status == TabState.NAVIGATING:
-        tick_navigating(slot)
-    elif slot.status == TabState.DETAIL_WAIT:
-        tick_detail_wait(slot)
-    elif slot.status == TabState.SCANNING:
-        tick_scanning(slot)
-    elif slot.status == TabState.NULL_CLICKED:
-        tick_null_clicked(slot)
-    elif slot.status == TabState.CONVERTING:
-        tick_converting(slot)
-    elif slot.status == TabState.READY:
-        tick_ready(slot)
-    elif slot.status == TabState.ADD_CLICKED:
-        tick_add_clicked(slot)
-    elif slot.status == TabState.CONFIRMING:
-        tick_confirming(slot)
     elif slot.status == TabState.VERIFYING:
         tick_verifying(slot, coordinator)
 
 
+# Micro-ticks that only need the slot; PENDING and VERIFYING take extra args.
+_SLOT_TICKS = {
+    TabState.NAVIGATING:   tick_navigating,
+    TabState.DETAIL_WAIT:  tick_detail_wait,
+    TabState.SCANNING:     tick_scanning,
+    TabState.NULL_CLICKED: tick_null_clicked,
+    TabState.CONVERTING:   tick_converting,
+    TabState.READY:        tick_ready,
+    TabState.ADD_CLICKED:  tick_add_clicked,
+    TabState.CONFIRMING:   tick_confirming,
+}
+
+
 # =================================================================================
 #  Board Navigation Helpers
 # =================================================================================
@@ -27,6 +27,45 @@ def get_worker_id() -> str:
     return socket.gethostname()
 
 
+# ── Coordination entry ageing (shared by coordinator + coordination_server) ──
+# A monotonic stamp is immune to NTP steps but only means something on the
+# clock that wrote it, so it is stored with that clock's identity: the host
+# and its boot time (wall - mono).  Stamps from another host or boot fall back
+# to wall-clock time.  The tolerance absorbs drift and small NTP corrections.
+_CLOCK_BOOT_TOLERANCE_S = 120.0
+
+
+def clock_stamp(wall: float | None = None, mono: float | None = None) -> dict:
+    """Return the update-time fields to store on a coordination entry."""
+    if wall is None or mono is None:
+        wall, mono = _time.time(), _time.monotonic()
+    return {
+        "updated_at": wall,
+        "monotonic_updated_at": mono,
+        "monotonic_clock": [get_worker_id(), round(wall - mono, 3)],
+    }
+
+
+def entry_age(entry: dict, wall: float, mono: float) -> float:
+    """
+    Seconds since a coordination entry was last updated.
+
+    Uses the monotonic stamp when it was written by this host during the
+    current boot; otherwise (older entries, a reboot, another machine sharing
+    the file) the wall-clock updated_at.
+    """
+    stamp = entry.get("monotonic_updated_at")
+    clock = entry.get("monotonic_clock")
+    if (
+        stamp is not None and stamp <= mono
+        and isinstance(clock, list) and len(clock) == 2
+        and clock[0] == get_worker_id()
+        and abs(clock[1] - (wall - mono)) < _CLOCK_BOOT_TOLERANCE_S
+    ):
+        return mono - stamp
+    return wall - entry.get("updated_at", 0)
+
+
 def setup_logging() -> logging.Logger:
     """Configure and return the project logger."""
     os.makedirs(LOG_DIR, exist_ok=True)
@@ -176,6 +215,8 @@ def load_config(config_path: str = None) -> dict:
     config.setdefault("coordination_file", "coordination.json")
     config.setdefault("coordination_stale_timeout", 1800)
     config.setdefault("coordination_reset_on_start", True)
+    config.setdefault("coordination_pretty_json", False)
+    config.setdefault("coordination_compress", False)
 
     # Coordination mode (file-based or HTTP server)
     mode = config.setdefault("coordination_mode", "file")
@@ -360,7 +401,9 @@ def adaptive_timeout(base_ms: int, image_count: int, per_image_ms: int, config:
 # Resource types that are safe to block in headless mode.
 # NOTE: "font" intentionally removed (P6 — font blocking causes zero-dimension
 # button layout failures in headless mode, making buttons "not visible").
-_BLOCKED_RESOURCE_TYPES = {"image", "media"}
+# Stylesheets stay for the same reason: visibility checks need real layout.
+# "ping" (sendBeacon), "manifest" and "texttrack" are never needed by the UI.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "ping", "manifest", "texttrack"})
 
 # URL patterns for heavy third-party assets that aren't needed for automation.
 _BLOCKED_URL_PATTERNS = [
@@ -376,10 +419,14 @@ _BLOCKED_URL_PATTERNS = [
 ]
 
 
+# Every request in the context passes through the route handler, so the
+# pattern list is matched as one precompiled alternation.
+_BLOCKED_URL_RE = re.compile("|".join(map(re.escape, _BLOCKED_URL_PATTERNS)), re.IGNORECASE)
+
+
 def _should_block(url: str) -> bool:
     """Return True if the URL matches a blocked third-party pattern."""
-    lower = url.lower()
-    return any(pattern in lower for pattern in _BLOCKED_URL_PATTERNS)
+    return _BLOCKED_URL_RE.search(url) is not None
 
 
 def optimize_context_for_headless(context) -> None:
@@ -412,4 +459,4 @@ def optimize_context_for_headless(context) -> None:
         route.continue_()
 
     context.route("**/*", _route_handler)
-    logger.info("Headless optimisation applied — blocking images, media & analytics (fonts allowed)")
+    logger.info("Headless optimisation applied — blocking images, media, beacons & analytics (fonts allowed)")